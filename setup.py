@@ -1,3 +1,4 @@
+import functools
 import os
 
 from setuptools import setup
@@ -5,6 +6,27 @@ from setuptools.command.develop import develop
 from setuptools.command.install import install
 
 
+@functools.lru_cache(maxsize=1)
+def _site_packages() -> str:
+    """Resolve the site-packages directory once per process."""
+    import site
+
+    return site.getsitepackages()[0]
+
+
+def _write_pth(site_packages: str) -> str:
+    """Write the jvm.pth bootstrap file into site-packages."""
+    pth_file = os.path.join(site_packages, "jvm.pth")
+
+    fd = os.open(pth_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        os.write(fd, b"import jvm\n")
+    finally:
+        os.close(fd)
+
+    return pth_file
+
+
 class PostInstallCommand(install):
     """Post-installation for installation mode."""
 
@@ -19,11 +41,8 @@ class PostInstallCommand(install):
             if site_packages is None:
                 print("Failed to get site-packages directory")
                 return
-            pth_file = os.path.join(site_packages, "jvm.pth")
-
-            with open(pth_file, "w") as f:
-                f.write("import jvm\n")
 
+            pth_file = _write_pth(site_packages)
             print(f"Installed .pth file: {pth_file}")
         except Exception as e:
             print(f"Failed to install .pth file: {e}")
@@ -39,14 +58,7 @@ class PostDevelopCommand(develop):
     def install_pth_file(self):
         """Install .pth file in site-packages directory for editable install"""
         try:
-            import site
-
-            site_packages = site.getsitepackages()[0]
-            pth_file = os.path.join(site_packages, "jvm.pth")
-
-            with open(pth_file, "w") as f:
-                f.write("import jvm\n")
-
+            pth_file = _write_pth(_site_packages())
             print(f"Installed .pth file for editable install: {pth_file}")
         except Exception as e:
             print(f"Failed to install .pth file for editable install: {e}")
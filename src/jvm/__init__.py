@@ -1,12 +1,8 @@
+import importlib
 import sys
+from typing import Any
 
-from . import import_hook, logger, typeconv
-from .config import Config
-from .jvm import JVM, JavaClass, JavaField, JavaMethod
-from .loader import JVMLoader
-from .stubgen import PyiStubGenerator
-
-# siteinit実行（初回のみ）
+# siteinit実行（初回のみ、import hook登録のみ即時）
 if "jvm.siteinit" not in sys.modules:
     from . import siteinit
 
@@ -26,3 +22,40 @@ __all__ = [
 ]
 
 __version__ = "0.1.0rc3"
+
+# 遅延インポート対象（属性名→モジュール名）
+_LAZY_SUBMODULES = {
+    "config": "jvm.config",
+    "import_hook": "jvm.import_hook",
+    "jvm": "jvm.jvm",
+    "loader": "jvm.loader",
+    "logger": "jvm.logger",
+    "stubgen": "jvm.stubgen",
+    "typeconv": "jvm.typeconv",
+}
+
+_LAZY_ATTRS = {
+    "Config": "jvm.config",
+    "JVM": "jvm.jvm",
+    "JavaClass": "jvm.jvm",
+    "JavaField": "jvm.jvm",
+    "JavaMethod": "jvm.jvm",
+    "JVMLoader": "jvm.loader",
+    "PyiStubGenerator": "jvm.stubgen",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """PEP 562遅延インポート（jvm.pth経由の起動コスト削減）"""
+    if name in _LAZY_SUBMODULES:
+        module = importlib.import_module(_LAZY_SUBMODULES[name])
+        globals()[name] = module
+        return module
+
+    if name in _LAZY_ATTRS:
+        module = importlib.import_module(_LAZY_ATTRS[name])
+        attr = getattr(module, name)
+        globals()[name] = attr
+        return attr
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
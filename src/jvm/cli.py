@@ -1,12 +1,15 @@
 from __future__ import annotations
 
 import argparse
+import hashlib
+import logging
 import os
 import platform
 import shutil
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional
+from typing import Any, Iterator, Optional, cast
 
 from .config import Config
 from .loader import JVMLoader
@@ -14,12 +17,15 @@ from .logger import logger
 from .stubgen import PyiStubGenerator
 
 # 定数定義
+_SYSTEM = platform.system().lower()
+_MISSING = object()
 STUB_PACKAGES = [
     "java.lang",
     "java.util",
     "java.io",
 ]
 TEMP_STUBS_DIR_NAME = "temp_stubs"
+STUB_FINGERPRINT_FILE = ".jvm_stub_fp"
 PACKAGE_STUBS_DIR_NAME = "package_stubs"
 JAVA_PACKAGE_NAME = "java"
 
@@ -28,15 +34,18 @@ class VirtualEnvironmentDetector:
     """仮想環境検出"""
 
     def __init__(self) -> None:
-        self.system = platform.system().lower()
+        self.system = _SYSTEM
+        self._cached_site_packages: Any = _MISSING
 
     def detect_venv(self) -> Optional[Path]:
-        """仮想環境検出"""
-        venv_path = self._get_venv_path()
-        if not venv_path:
-            return None
+        """仮想環境検出（初回のみ探索）"""
+        if self._cached_site_packages is _MISSING:
+            venv_path = self._get_venv_path()
+            self._cached_site_packages = (
+                self._get_site_packages_path(venv_path) if venv_path else None
+            )
 
-        return self._get_site_packages_path(venv_path)
+        return cast(Optional[Path], self._cached_site_packages)
 
     def _get_venv_path(self) -> Optional[Path]:
         """仮想環境パス取得"""
@@ -65,7 +74,9 @@ class StubFileManager:
     """スタブファイル管理"""
 
     def __init__(self) -> None:
-        self.system = platform.system().lower()
+        self.system = _SYSTEM
+        # 直近に全パッケージ成功で生成したフィンガープリント (失敗時はNone)
+        self._last_fingerprint: Optional[str] = None
 
     def get_stub_source_dir(self) -> Path:
         """スタブソースディレクトリ取得"""
@@ -82,44 +93,149 @@ class StubFileManager:
 
         raise FileNotFoundError("Could not find package_stubs directory")
 
-    def generate_stubs(self, output_dir: Path) -> None:
-        """スタブファイル生成"""
-        logger.info("Generating fresh stub files...")
+    def _stub_fingerprint(self, config: Config) -> str:
+        """スタブ世代フィンガープリント計算（JDK・クラスパス変更検出用）"""
+        parts = [config.java_version, os.pathsep.join(config.classpath)]
+        try:
+            libjvm = JVMLoader(config)._find_libjvm(config.java_version)
+            parts.append(libjvm)
+            parts.append(str(os.stat(libjvm).st_mtime_ns))
+        except Exception:
+            pass
+        return hashlib.sha256("\0".join(parts).encode("utf-8")).hexdigest()
+
+    def generate_stubs(
+        self, output_dir: Path, marker_file: Optional[Path] = None
+    ) -> bool:
+        """スタブファイル生成
 
+        marker_fileが現行フィンガープリントと一致する場合は再生成を
+        スキップする。markerは生成物と同居させず、インストール先など
+        永続する場所を渡すこと (一時ディレクトリは毎回消えるため)。
+        """
+        self._last_fingerprint = None
         config = Config.from_pyproject()
+
+        # JDKが変わっていなければ既存スタブを再利用
+        fingerprint = self._stub_fingerprint(config)
+        if marker_file is not None:
+            try:
+                if marker_file.exists() and marker_file.read_text() == fingerprint:
+                    logger.info("Stub cache is up to date, skipping regeneration")
+                    self._last_fingerprint = fingerprint
+                    return True
+            except OSError:
+                pass
+
+        logger.info("Generating fresh stub files...")
+
         jvm = JVMLoader(config).start()
         generator = PyiStubGenerator(jvm, str(output_dir))
 
+        # JNIEnvは取得したスレッドでのみ有効なため直列に生成する
+        # (並列化するならワーカー毎にAttachCurrentThreadが必要)
+        all_succeeded = True
         for package in STUB_PACKAGES:
-            self._generate_package_stub(generator, package)
+            if not self._generate_package_stub(generator, package):
+                all_succeeded = False
+
+        # 失敗を含む世代を固定しないよう、全成功時のみmarker書き込みを許可
+        if all_succeeded:
+            self._last_fingerprint = fingerprint
+        return all_succeeded
+
+    def write_fingerprint_marker(self, marker_file: Path) -> None:
+        """直近の生成が全成功していればフィンガープリントを永続化"""
+        if self._last_fingerprint is None:
+            return
+        try:
+            marker_file.write_text(self._last_fingerprint)
+        except OSError as e:
+            logger.warning(f"Failed to write stub fingerprint: {e}")
 
-    def _generate_package_stub(self, generator: PyiStubGenerator, package: str) -> None:
+    def _generate_package_stub(self, generator: PyiStubGenerator, package: str) -> bool:
         """パッケージスタブ生成"""
         try:
             stub_file = generator.generate_package_stub(package)
             logger.info(f"Generated stub for {package}: {stub_file}")
+            return True
         except Exception as e:
             logger.warning(f"Failed to generate stub for {package}: {e}")
+            return False
+
+    @staticmethod
+    def _iter_pyi(root: Path) -> Iterator[tuple[str, str]]:
+        """`.pyi`ファイル走査（os.scandirベース）"""
+        prefix_len = len(str(root)) + 1
+        dirs = [str(root)]
+
+        while dirs:
+            current = dirs.pop()
+            try:
+                with os.scandir(current) as entries:
+                    for entry in entries:
+                        if entry.is_dir():
+                            dirs.append(entry.path)
+                        elif entry.name.endswith(".pyi") and entry.is_file():
+                            yield entry.path, entry.path[prefix_len:]
+            except OSError as e:
+                logger.warning(f"Failed to scan directory {current}: {e}")
 
     def copy_stubs_to_site_packages(
         self, stubs_source: Path, site_packages: Path
     ) -> bool:
         """スタブファイルコピー"""
-        success = True
+        pairs: list[tuple[str, str]] = []
+        created_dirs: set[str] = set()
+
+        # ワーカーのmkdir競合を避けるため親ディレクトリを先に作成
+        for src_path, rel_path in self._iter_pyi(stubs_source):
+            target_file = os.path.join(site_packages, rel_path)
+            target_dir = os.path.dirname(target_file)
+            if target_dir not in created_dirs:
+                os.makedirs(target_dir, exist_ok=True)
+                created_dirs.add(target_dir)
+            pairs.append((src_path, target_file))
+
+        if not pairs:
+            return True
+
+        # 同一ファイルシステムならハードリンクでデータコピー自体を省略
+        try:
+            same_device = os.stat(stubs_source).st_dev == os.stat(site_packages).st_dev
+        except OSError:
+            same_device = False
 
-        for stub_file in stubs_source.rglob("*.pyi"):
-            rel_path = stub_file.relative_to(stubs_source)
-            target_file = site_packages / rel_path
+        failures: list[tuple[str, Exception]] = []
+        debug_enabled = logger.is_enabled_for(logging.DEBUG)
 
+        def _copy_one(pair: tuple[str, str]) -> None:
+            src, dst = pair
             try:
-                target_file.parent.mkdir(parents=True, exist_ok=True)
-                shutil.copy2(stub_file, target_file)
-                logger.info(f"Installed: {rel_path}")
+                if same_device:
+                    try:
+                        os.link(src, dst)
+                        if debug_enabled:
+                            logger.debug(f"Installed (hardlink): {dst}")
+                        return
+                    except OSError:
+                        # EEXIST/EXDEV等は通常コピーにフォールバック
+                        pass
+                shutil.copyfile(src, dst)
+                if debug_enabled:
+                    logger.debug(f"Installed: {dst}")
             except Exception as e:
-                logger.error(f"Failed to install {rel_path}: {e}")
-                success = False
+                failures.append((dst, e))
 
-        return success
+        max_workers = min(32, (os.cpu_count() or 1) * 4)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            list(executor.map(_copy_one, pairs))
+
+        for target_file, error in failures:
+            logger.error(f"Failed to install {target_file}: {error}")
+
+        logger.info(f"Installed {len(pairs) - len(failures)} stub files")
+        return not failures
 
     def cleanup_temp_directory(self, temp_dir: Path) -> None:
         """一時ディレクトリクリーンアップ"""
@@ -143,7 +259,9 @@ class StubInstaller:
 
         logger.info(f"Installing stubs to: {site_packages}")
 
-        stubs_source, temp_dir = self._get_stub_source(force_regenerate)
+        # markerは一時ディレクトリではなくインストール先に永続化する
+        marker_file = site_packages / STUB_FINGERPRINT_FILE
+        stubs_source, temp_dir = self._get_stub_source(force_regenerate, marker_file)
         if not stubs_source:
             return False
 
@@ -152,6 +270,9 @@ class StubInstaller:
         )
 
         if temp_dir:
+            # 生成とインストールが両方成功した世代のみ固定する
+            if success:
+                self.file_manager.write_fingerprint_marker(marker_file)
             self.file_manager.cleanup_temp_directory(temp_dir)
 
         self._log_installation_result(success)
@@ -167,13 +288,14 @@ class StubInstaller:
         )
 
     def _get_stub_source(
-        self, force_regenerate: bool
+        self, force_regenerate: bool, marker_file: Optional[Path] = None
     ) -> tuple[Optional[Path], Optional[Path]]:
         """スタブソース取得"""
         temp_dir = None
 
         if force_regenerate:
-            temp_dir = self._create_temp_stubs()
+            # 強制再生成ではmarkerの一致チェックを迂回する
+            temp_dir = self._create_temp_stubs(None)
             return temp_dir, temp_dir
 
         try:
@@ -181,14 +303,14 @@ class StubInstaller:
         except FileNotFoundError as e:
             logger.warning(f"{e}")
             logger.info("Generating fresh stub files...")
-            temp_dir = self._create_temp_stubs()
+            temp_dir = self._create_temp_stubs(marker_file)
             return temp_dir, temp_dir
 
-    def _create_temp_stubs(self) -> Path:
+    def _create_temp_stubs(self, marker_file: Optional[Path] = None) -> Path:
         """一時スタブディレクトリ作成"""
         temp_stubs_dir = Path.cwd() / TEMP_STUBS_DIR_NAME
         temp_stubs_dir.mkdir(exist_ok=True)
-        self.file_manager.generate_stubs(temp_stubs_dir)
+        self.file_manager.generate_stubs(temp_stubs_dir, marker_file)
         return temp_stubs_dir
 
     def _log_installation_result(self, success: bool) -> None:
@@ -218,6 +340,13 @@ class StubInstaller:
         else:
             logger.info("No java stubs found to remove")
 
+        # markerを残すと次回インストールが再生成をスキップしてしまう
+        marker_file = site_packages / STUB_FINGERPRINT_FILE
+        try:
+            marker_file.unlink(missing_ok=True)
+        except OSError as e:
+            logger.warning(f"Failed to remove stub fingerprint: {e}")
+
         logger.info("✓ Stub uninstallation completed!")
         return True
 
@@ -232,8 +361,11 @@ class StubInstaller:
         logger.info(f"Installing jvm.pth to: {pth_file}")
 
         try:
-            with open(pth_file, "w", encoding="utf-8") as f:
-                f.write("import jvm\n")
+            fd = os.open(str(pth_file), os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+            try:
+                os.write(fd, b"import jvm\n")
+            finally:
+                os.close(fd)
             logger.info("✓ jvm.pth file installed successfully!")
             logger.info(
                 "Now you can use 'from java.lang import System' directly in any Python script"
@@ -1,8 +1,9 @@
 from __future__ import annotations
 
+import os
 import sys
-import tomllib
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, List, Optional
 
@@ -24,39 +25,70 @@ class Config:
             return cls(java_version="17", deps={}, classpath=[])
 
         try:
-            with open(pyproject_path, "rb") as f:
-                data = tomllib.load(f)
+            cached = cls._load_pyproject(
+                str(pyproject_path), pyproject_path.stat().st_mtime_ns
+            )
+            # キャッシュ済みインスタンスの変更を避けるためコピーを返す
+            return cls(
+                java_version=cached.java_version,
+                deps={key: list(value) for key, value in cached.deps.items()},
+                classpath=list(cached.classpath),
+            )
 
-            tool_jvm = data.get("tool", {}).get("jvm", {})
+        except Exception:
+            return cls(java_version="17", deps={}, classpath=[])
 
-            java_version = tool_jvm.get("java-version", "17")
-            deps = tool_jvm.get("deps", {})
-            classpath = tool_jvm.get("classpath", [])
+    @staticmethod
+    @lru_cache(maxsize=8)
+    def _load_pyproject(pyproject_path: str, mtime_ns: int) -> Config:
+        """pyproject.toml解析（パスとmtimeでキャッシュ）"""
+        with open(pyproject_path, "rb") as f:
+            raw = f.read()
 
-            return cls(java_version=java_version, deps=deps, classpath=classpath)
+        # [tool.jvm]セクションが無ければTOMLパーサ起動をスキップ
+        if b"[tool.jvm]" not in raw and b"[tool.jvm." not in raw:
+            return Config(java_version="17", deps={}, classpath=[])
 
-        except Exception:
-            return cls(java_version="17", deps={}, classpath=[])
+        import tomllib
+
+        data = tomllib.loads(raw.decode("utf-8"))
+
+        tool_jvm = data.get("tool", {}).get("jvm", {})
+
+        return Config(
+            java_version=tool_jvm.get("java-version", "17"),
+            deps=tool_jvm.get("deps", {}),
+            classpath=tool_jvm.get("classpath", []),
+        )
 
     @staticmethod
     def _find_pyproject_toml(search_path: Optional[str] = None) -> Optional[Path]:
         """pyproject.toml検索"""
         entry_dir = Path(sys.path[0]) if sys.path[0] else Path.cwd()
-        entry_pyproject = entry_dir / "pyproject.toml"
-        if entry_pyproject.exists():
-            return entry_pyproject
 
         if search_path:
-            current_dir = Path(search_path)
+            start_dir = Path(search_path)
         else:
-            current_dir = Path.cwd()
+            start_dir = Path.cwd()
 
+        return Config._search_pyproject_toml(str(entry_dir), str(start_dir))
+
+    @staticmethod
+    @lru_cache(maxsize=8)
+    def _search_pyproject_toml(entry_dir: str, start_dir: str) -> Optional[Path]:
+        """pyproject.toml探索（検索起点でキャッシュ）"""
+        # Path生成を成功時のみに抑え、文字列操作とisfileで親を遡る
+        entry_pyproject = os.path.join(entry_dir, "pyproject.toml")
+        if os.path.isfile(entry_pyproject):
+            return Path(entry_pyproject)
+
+        current_dir = start_dir
         while True:
-            pyproject_path = current_dir / "pyproject.toml"
-            if pyproject_path.exists():
-                return pyproject_path
+            pyproject_path = os.path.join(current_dir, "pyproject.toml")
+            if os.path.isfile(pyproject_path):
+                return Path(pyproject_path)
 
-            parent = current_dir.parent
+            parent = os.path.dirname(current_dir)
             if parent == current_dir:
                 break
             current_dir = parent
@@ -1,45 +1,63 @@
 import threading
 from importlib.abc import MetaPathFinder
 from importlib.machinery import ModuleSpec
-from typing import Any, Optional, Sequence
+from typing import TYPE_CHECKING, Any, Optional, Sequence
 
-from ..config import Config
-from ..jvm import JVM
-from ..loader import JVMLoader
-from ..logger import logger
-from .loader import JavaLoader
+if TYPE_CHECKING:
+    from ..jvm import JVM
+
+# JavaFinderは実質シングルトンのためロックはモジュールレベルで共有
+_jvm_lock = threading.Lock()
 
 
 class JavaFinder(MetaPathFinder):
     """Javaパッケージファインダー"""
 
     _PREFIXES = ("java.", "javax.", "jdk.")
+    _ROOTS = frozenset(("java", "javax", "jdk"))
 
     def __init__(self) -> None:
-        self._jvm: Optional[JVM] = None
-        self._jvm_lock = threading.Lock()
+        self._jvm: Optional["JVM"] = None
+        self._jvm_lock = _jvm_lock
         self._shutdown_registered = False
 
-    def _get_jvm(self) -> JVM:
+    def _get_jvm(self) -> "JVM":
         """遅延JVM初期化"""
-        if self._jvm is None:
+        jvm = self._jvm
+        if jvm is None:
             with self._jvm_lock:
-                if self._jvm is None:
+                jvm = self._jvm
+                if jvm is None:
+                    # JVMスタック (config/jni/loader等) のimport自体も
+                    # 初回のJava importまで遅延させる
+                    from ..config import Config
+                    from ..loader import JVMLoader
+                    from ..logger import logger
+
                     logger.info("Initializing JVM...")
                     _cfg = Config.from_pyproject()
-                    self._jvm = JVMLoader(_cfg).start()
+                    jvm = JVMLoader(_cfg).start()
+                    self._jvm = jvm
                     logger.info("JVM initialized")
 
-        return self._jvm
+        # 以後の呼び出しはロックとNoneチェックを完全にスキップ
+        self._get_jvm = lambda: jvm  # type: ignore[method-assign]
+        return jvm
 
     def find_spec(
         self, fullname: str, path: Optional[Sequence[str]], target: Optional[Any] = None
     ) -> Optional[ModuleSpec]:
-        if fullname == "java" or fullname.startswith(self._PREFIXES):
-            jvm = self._get_jvm()
-            return ModuleSpec(
-                name=fullname,
-                loader=JavaLoader(jvm, fullname),
-                is_package="." in fullname,
-            )
-        return None
+        # 全import文で呼ばれるため、非Java importを単一ハッシュ照合で即座に除外
+        dot = fullname.find(".")
+        root = fullname if dot < 0 else fullname[:dot]
+        if root not in self._ROOTS:
+            return None
+
+        jvm = self._get_jvm()
+        from .loader import JavaLoader
+
+        return ModuleSpec(
+            name=fullname,
+            loader=JavaLoader(jvm, fullname),
+            is_package="." in fullname,
+        )
@@ -1,3 +1,5 @@
+import threading
+from functools import lru_cache
 from importlib.abc import Loader
 from importlib.machinery import ModuleSpec
 from types import ModuleType
@@ -6,6 +8,16 @@ from typing import Any, Optional
 from ..jvm import JVM
 from ..proxy import ClassProxy, PackageProxy
 
+# JNIプローブ結果をローダー間で共有（失敗は例外のためlru_cacheに乗らない）
+_probe_lock = threading.Lock()
+_known_not_class: set[tuple[int, str]] = set()
+
+
+@lru_cache(maxsize=4096)
+def _find_class_cached(jvm: JVM, jni_name: str) -> Any:
+    """クラスプローブ共有キャッシュ"""
+    return jvm.find_class(jni_name)
+
 
 class JavaLoader(Loader):
     """Javaローダー"""
@@ -37,14 +49,35 @@ class JavaLoader(Loader):
 
         _ = (pkg_path, leaf)
 
-        # クラスorパッケージ判定
+        # クラスorパッケージ判定結果をモジュール単位でメモ化
+        _cache: dict[str, Any] = {}
+
         def _lazy_attr(name: str) -> Any:
+            proxy = _cache.get(name)
+            if proxy is not None:
+                return proxy
+
             fqcn = f"{self.fullname}.{name}"
-            try:
-                self.jvm.find_class(fqcn.replace(".", "/"))
-                return ClassProxy(self.jvm, fqcn)
-            except Exception:
-                return PackageProxy(self.jvm, fqcn)
+            probe_key = (id(self.jvm), fqcn)
+
+            with _probe_lock:
+                known_miss = probe_key in _known_not_class
+
+            if known_miss:
+                proxy = PackageProxy(self.jvm, fqcn)
+            else:
+                try:
+                    _find_class_cached(self.jvm, fqcn.replace(".", "/"))
+                    proxy = ClassProxy(self.jvm, fqcn)
+                except Exception:
+                    with _probe_lock:
+                        _known_not_class.add(probe_key)
+                    proxy = PackageProxy(self.jvm, fqcn)
+
+            _cache[name] = proxy
+            # 次回アクセスは__getattr__を経由せず通常の属性参照で解決させる
+            setattr(module, name, proxy)
+            return proxy
 
         setattr(module, "__getattr__", _lazy_attr)
         setattr(module, "__repr__", lambda: f"<Java package {self.fullname}>")
@@ -1,9 +1,21 @@
-"""JNI関数バインディング"""
+"""JNI関数バインディング
+
+ディスパッチはctypesのPyCFuncPtr直叩きで行う。関数ポインタは
+JNIHelper生成時に一度だけ束縛し、以降の呼び出しはネイティブ
+トランポリンへの直接コールになるため、cffi等の追加依存なしで
+FFIオーバーヘッドを抑えている（本パッケージは依存ゼロを維持する）。
+"""
 
 from __future__ import annotations
 
+import contextlib
 import ctypes
+import functools
 import platform
+import struct
+import threading
+import types
+from collections import OrderedDict
 from ctypes import (
     POINTER,
     Union,
@@ -18,9 +30,7 @@ from ctypes import (
     c_short,
     c_void_p,
 )
-from typing import Any, Optional, cast
-
-from .logger import logger
+from typing import Any, Callable, Iterator, Optional
 
 # JNI基本型
 jboolean = c_bool
@@ -34,6 +44,10 @@ jdouble = c_double
 jobject = c_void_p
 
 
+# ABIは全対応プラットフォームで8バイト境界（実行時の再確認は不要）
+_IS_DARWIN_ARM64 = platform.system() == "Darwin" and platform.machine() == "arm64"
+
+
 class jvalue(Union):
     """JNI引数共用体"""
 
@@ -49,49 +63,96 @@ class jvalue(Union):
         ("l", jobject),
     ]
 
-    # ARM64 macOS用アライメント
-    if platform.system() == "Darwin" and platform.machine() == "arm64":
-        _pack_ = 8
-        _align_ = 8
+    _pack_ = 8
+    _align_ = 8
+
+
+# jvalueスロット書き込み用（ctypes Unionフィールド代入より大幅に軽量）
+_JVALUE_SIZE = 8
+_S_B = struct.Struct("<B")
+_S_i = struct.Struct("<i")
+_S_q = struct.Struct("<q")
+_S_d = struct.Struct("<d")
+_S_P = struct.Struct("<Q")
+
+_string_at = ctypes.string_at
+
+
+def _handle_key(handle: Any) -> Any:
+    """ctypesハンドルを辞書キー向けの生アドレスへ正規化"""
+    return handle if isinstance(handle, int) else handle.value
+
+
+_JINT_MIN = -0x80000000
+_JINT_MAX = 0x7FFFFFFF
+_PTR_MASK = 0xFFFFFFFFFFFFFFFF
+
+
+def _set_z(buf: Any, off: int, val: Any) -> None:
+    _S_B.pack_into(buf, off, 1 if val else 0)
+
+
+def _set_i_or_j(buf: Any, off: int, val: Any) -> None:
+    if _JINT_MIN <= val <= _JINT_MAX:
+        _S_i.pack_into(buf, off, val)
     else:
-        _pack_ = 8
+        _S_q.pack_into(buf, off, val)
 
 
-def _convert_args_to_jvalue_array(args: tuple[Any, ...]) -> tuple[Any, int]:
-    """Python引数をjvalue配列に変換"""
-    if not args:
-        return None, 0
+def _set_d(buf: Any, off: int, val: Any) -> None:
+    _S_d.pack_into(buf, off, val)
 
-    jvalue_array = (jvalue * len(args))()
 
-    # ARM64 macOSでのアライメント調整
-    if platform.system() == "Darwin" and platform.machine() == "arm64":
-        array_addr = ctypes.addressof(jvalue_array)
-        if array_addr % 8 != 0:
-            aligned_array = (jvalue * len(args))()
-            aligned_addr = ctypes.addressof(aligned_array)
-            if aligned_addr % 8 == 0:
-                jvalue_array = aligned_array
+_MISSING_VALUE = object()
+
+
+def _set_l(buf: Any, off: int, val: Any) -> None:
+    if val is None:
+        return
+    value: Any = val if isinstance(val, int) else getattr(val, "value", _MISSING_VALUE)
+    if value is _MISSING_VALUE:
+        # 黙ってNULLを詰めるとJava側の遅延NPEになるため、基準実装の
+        # jobject(arg)と同様にPython側で型エラーとして弾く
+        raise TypeError(f"Cannot convert {type(val).__name__} to jobject")
+    if value:
+        _S_P.pack_into(buf, off, value & _PTR_MASK)
+
+
+# type(arg)同一性キーのディスパッチ表（isinstance連鎖より軽い）
+_JVALUE_SETTERS = {bool: _set_z, int: _set_i_or_j, float: _set_d}
 
-    for i, arg in enumerate(args):
-        ctypes.memset(ctypes.byref(jvalue_array[i]), 0, ctypes.sizeof(jvalue))
 
-        if isinstance(arg, bool):
-            jvalue_array[i].z = jboolean(arg)
+def _fill_jvalue_buffer(buf: Any, args: tuple[Any, ...]) -> None:
+    """ゼロ初期化済みバッファへjvalueスロットを書き込む
+
+    正確な型一致はディスパッチ表で最速経路を取り、表にない型は
+    isinstance連鎖へフォールバックする (int/floatのサブクラス、
+    例えばnumpyのスカラをオブジェクト扱いしないため)。
+    """
+    setters = _JVALUE_SETTERS
+    for i, arg in enumerate(args):
+        setter = setters.get(type(arg))
+        if setter is not None:
+            setter(buf, i * _JVALUE_SIZE, arg)
+        elif isinstance(arg, bool):
+            _set_z(buf, i * _JVALUE_SIZE, arg)
         elif isinstance(arg, int):
-            if -(2**31) <= arg <= 2**31 - 1:
-                jvalue_array[i].i = jint(arg)
-            else:
-                jvalue_array[i].j = jlong(arg)
+            _set_i_or_j(buf, i * _JVALUE_SIZE, arg)
         elif isinstance(arg, float):
-            jvalue_array[i].d = jdouble(arg)
+            _set_d(buf, i * _JVALUE_SIZE, arg)
         else:
-            if isinstance(arg, int) or hasattr(arg, "value"):
-                jvalue_array[i].l = arg
-            else:
-                jvalue_array[i].l = jobject(arg) if arg is not None else jobject(0)
+            _set_l(buf, i * _JVALUE_SIZE, arg)
+
+
+def _convert_args_to_jvalue_array(args: tuple[Any, ...]) -> tuple[Any, int]:
+    """Python引数をjvalue配列に変換"""
+    if not args:
+        return None, 0
 
-    return jvalue_array, len(args)
+    # c_ubyteバッファはゼロ初期化かつ8バイト境界配置（memset・再確保不要）
+    buf = (ctypes.c_ubyte * (_JVALUE_SIZE * len(args)))()
+    _fill_jvalue_buffer(buf, args)
+    return buf, len(args)
 
 
 class JNIFunctionIndices:
@@ -332,6 +393,23 @@ class JNIFunctionIndices:
     GetObjectRefType = 232
 
 
+@functools.lru_cache(maxsize=4096)
+def _utf8(s: str) -> bytes:
+    """クラス名・シグネチャ等の反復的なUTF-8エンコードをキャッシュ"""
+    return s.encode("utf-8")
+
+
+@functools.lru_cache(maxsize=None)
+def _cfunc(restype: Any, *argtypes: Any) -> Any:
+    """シグネチャ単位でCFUNCTYPE型を共有（同型関数型の再生成を回避）
+
+    CFUNCTYPE経由の呼び出しはGILを解放するため、MonitorEnter等の
+    ブロッキングJNI呼び出し中も他のPythonスレッドは進行できる
+    （PYFUNCTYPEにしないこと）。
+    """
+    return ctypes.CFUNCTYPE(restype, *argtypes)
+
+
 class JNIPrototypes:
     """JNI関数プロトタイプ"""
 
@@ -348,109 +426,351 @@ class JNIPrototypes:
     jint = c_int
     jboolean = c_bool
 
-    GetVersion = ctypes.CFUNCTYPE(jint, JNIEnv)
-    DefineClass = ctypes.CFUNCTYPE(
+    GetVersion = _cfunc(jint, JNIEnv)
+    DefineClass = _cfunc(
         jclass, JNIEnv, c_char_p, jobject, POINTER(ctypes.c_byte), jsize
     )
-    FindClass = ctypes.CFUNCTYPE(jclass, JNIEnv, c_char_p)
-    GetSuperclass = ctypes.CFUNCTYPE(jclass, JNIEnv, jclass)
-    IsAssignableFrom = ctypes.CFUNCTYPE(jboolean, JNIEnv, jclass, jclass)
-    AllocObject = ctypes.CFUNCTYPE(jobject, JNIEnv, jclass)
-    NewObject = ctypes.CFUNCTYPE(jobject, JNIEnv, jclass, jmethodID)
-    NewObjectV = ctypes.CFUNCTYPE(jobject, JNIEnv, jclass, jmethodID, ctypes.c_char_p)
-    NewObjectA = ctypes.CFUNCTYPE(jobject, JNIEnv, jclass, jmethodID, POINTER(c_void_p))
-    GetObjectClass = ctypes.CFUNCTYPE(jclass, JNIEnv, jobject)
-    IsInstanceOf = ctypes.CFUNCTYPE(jboolean, JNIEnv, jobject, jclass)
-    IsSameObject = ctypes.CFUNCTYPE(jboolean, JNIEnv, jobject, jobject)
-    GetMethodID = ctypes.CFUNCTYPE(jmethodID, JNIEnv, jclass, c_char_p, c_char_p)
-    CallObjectMethod = ctypes.CFUNCTYPE(jobject, JNIEnv, jobject, jmethodID)
-    CallObjectMethodV = ctypes.CFUNCTYPE(
-        jobject, JNIEnv, jobject, jmethodID, ctypes.c_char_p
-    )
-    CallObjectMethodA = ctypes.CFUNCTYPE(
-        jobject, JNIEnv, jobject, jmethodID, POINTER(jvalue)
-    )
-    CallBooleanMethod = ctypes.CFUNCTYPE(jboolean, JNIEnv, jobject, jmethodID)
-    CallIntMethod = ctypes.CFUNCTYPE(jint, JNIEnv, jobject, jmethodID)
-    CallVoidMethod = ctypes.CFUNCTYPE(None, JNIEnv, jobject, jmethodID)
-    CallVoidMethodA = ctypes.CFUNCTYPE(
-        None, JNIEnv, jobject, jmethodID, POINTER(jvalue)
-    )
-    GetStaticMethodID = ctypes.CFUNCTYPE(jmethodID, JNIEnv, jclass, c_char_p, c_char_p)
-    CallStaticObjectMethod = ctypes.CFUNCTYPE(jobject, JNIEnv, jclass, jmethodID)
-    CallStaticObjectMethodV = ctypes.CFUNCTYPE(
+    FindClass = _cfunc(jclass, JNIEnv, c_char_p)
+    GetSuperclass = _cfunc(jclass, JNIEnv, jclass)
+    IsAssignableFrom = _cfunc(jboolean, JNIEnv, jclass, jclass)
+    AllocObject = _cfunc(jobject, JNIEnv, jclass)
+    NewObject = _cfunc(jobject, JNIEnv, jclass, jmethodID)
+    NewObjectV = _cfunc(jobject, JNIEnv, jclass, jmethodID, ctypes.c_char_p)
+    NewObjectA = _cfunc(jobject, JNIEnv, jclass, jmethodID, POINTER(c_void_p))
+    GetObjectClass = _cfunc(jclass, JNIEnv, jobject)
+    IsInstanceOf = _cfunc(jboolean, JNIEnv, jobject, jclass)
+    IsSameObject = _cfunc(jboolean, JNIEnv, jobject, jobject)
+    GetMethodID = _cfunc(jmethodID, JNIEnv, jclass, c_char_p, c_char_p)
+    CallObjectMethod = _cfunc(jobject, JNIEnv, jobject, jmethodID)
+    CallObjectMethodV = _cfunc(jobject, JNIEnv, jobject, jmethodID, ctypes.c_char_p)
+    CallObjectMethodA = _cfunc(jobject, JNIEnv, jobject, jmethodID, POINTER(jvalue))
+    CallBooleanMethod = _cfunc(jboolean, JNIEnv, jobject, jmethodID)
+    CallIntMethod = _cfunc(jint, JNIEnv, jobject, jmethodID)
+    CallVoidMethod = _cfunc(None, JNIEnv, jobject, jmethodID)
+    CallVoidMethodA = _cfunc(None, JNIEnv, jobject, jmethodID, POINTER(jvalue))
+    GetStaticMethodID = _cfunc(jmethodID, JNIEnv, jclass, c_char_p, c_char_p)
+    CallStaticObjectMethod = _cfunc(jobject, JNIEnv, jclass, jmethodID)
+    CallStaticObjectMethodV = _cfunc(
         jobject, JNIEnv, jclass, jmethodID, ctypes.c_char_p
     )
-    CallStaticObjectMethodA = ctypes.CFUNCTYPE(
+    CallStaticObjectMethodA = _cfunc(
         jobject, JNIEnv, jclass, jmethodID, POINTER(jvalue)
     )
-    CallStaticVoidMethod = ctypes.CFUNCTYPE(None, JNIEnv, jclass, jmethodID)
-    CallStaticVoidMethodV = ctypes.CFUNCTYPE(
-        None, JNIEnv, jclass, jmethodID, ctypes.c_char_p
-    )
-    CallStaticVoidMethodA = ctypes.CFUNCTYPE(
-        None, JNIEnv, jclass, jmethodID, POINTER(jvalue)
-    )
-    GetFieldID = ctypes.CFUNCTYPE(jfieldID, JNIEnv, jclass, c_char_p, c_char_p)
-    GetObjectField = ctypes.CFUNCTYPE(jobject, JNIEnv, jobject, jfieldID)
-    SetObjectField = ctypes.CFUNCTYPE(None, JNIEnv, jobject, jfieldID, jobject)
-    GetStaticFieldID = ctypes.CFUNCTYPE(jfieldID, JNIEnv, jclass, c_char_p, c_char_p)
-    GetStaticObjectField = ctypes.CFUNCTYPE(jobject, JNIEnv, jclass, jfieldID)
-    SetStaticObjectField = ctypes.CFUNCTYPE(None, JNIEnv, jclass, jfieldID, jobject)
-    NewString = ctypes.CFUNCTYPE(jstring, JNIEnv, POINTER(ctypes.c_uint16), jsize)
-    GetStringLength = ctypes.CFUNCTYPE(jsize, JNIEnv, jstring)
-    GetStringChars = ctypes.CFUNCTYPE(
+    CallStaticVoidMethod = _cfunc(None, JNIEnv, jclass, jmethodID)
+    CallStaticVoidMethodV = _cfunc(None, JNIEnv, jclass, jmethodID, ctypes.c_char_p)
+    CallStaticVoidMethodA = _cfunc(None, JNIEnv, jclass, jmethodID, POINTER(jvalue))
+    GetFieldID = _cfunc(jfieldID, JNIEnv, jclass, c_char_p, c_char_p)
+    GetObjectField = _cfunc(jobject, JNIEnv, jobject, jfieldID)
+    GetIntField = _cfunc(jint, JNIEnv, jobject, jfieldID)
+    GetLongField = _cfunc(jlong, JNIEnv, jobject, jfieldID)
+    SetObjectField = _cfunc(None, JNIEnv, jobject, jfieldID, jobject)
+    GetStaticFieldID = _cfunc(jfieldID, JNIEnv, jclass, c_char_p, c_char_p)
+    GetStaticObjectField = _cfunc(jobject, JNIEnv, jclass, jfieldID)
+    SetStaticObjectField = _cfunc(None, JNIEnv, jclass, jfieldID, jobject)
+    NewString = _cfunc(jstring, JNIEnv, POINTER(ctypes.c_uint16), jsize)
+    GetStringLength = _cfunc(jsize, JNIEnv, jstring)
+    GetStringChars = _cfunc(
         POINTER(ctypes.c_uint16), JNIEnv, jstring, POINTER(jboolean)
     )
-    ReleaseStringChars = ctypes.CFUNCTYPE(
-        None, JNIEnv, jstring, POINTER(ctypes.c_uint16)
-    )
-    NewStringUTF = ctypes.CFUNCTYPE(jstring, JNIEnv, c_char_p)
-    GetStringUTFLength = ctypes.CFUNCTYPE(jsize, JNIEnv, jstring)
-    GetStringUTFChars = ctypes.CFUNCTYPE(c_char_p, JNIEnv, jstring, POINTER(jboolean))
-    ReleaseStringUTFChars = ctypes.CFUNCTYPE(None, JNIEnv, jstring, c_char_p)
-    GetArrayLength = ctypes.CFUNCTYPE(jsize, JNIEnv, jarray)
-    NewObjectArray = ctypes.CFUNCTYPE(jarray, JNIEnv, jsize, jclass, jobject)
-    GetObjectArrayElement = ctypes.CFUNCTYPE(jobject, JNIEnv, jarray, jsize)
-    SetObjectArrayElement = ctypes.CFUNCTYPE(None, JNIEnv, jarray, jsize, jobject)
-    Throw = ctypes.CFUNCTYPE(jint, JNIEnv, jthrowable)
-    ThrowNew = ctypes.CFUNCTYPE(jint, JNIEnv, jclass, c_char_p)
-    ExceptionOccurred = ctypes.CFUNCTYPE(jthrowable, JNIEnv)
-    ExceptionDescribe = ctypes.CFUNCTYPE(None, JNIEnv)
-    ExceptionClear = ctypes.CFUNCTYPE(None, JNIEnv)
-    FatalError = ctypes.CFUNCTYPE(None, JNIEnv, c_char_p)
-    ExceptionCheck = ctypes.CFUNCTYPE(jboolean, JNIEnv)
-    NewGlobalRef = ctypes.CFUNCTYPE(jobject, JNIEnv, jobject)
-    DeleteGlobalRef = ctypes.CFUNCTYPE(None, JNIEnv, jobject)
-    DeleteLocalRef = ctypes.CFUNCTYPE(None, JNIEnv, jobject)
-    NewLocalRef = ctypes.CFUNCTYPE(jobject, JNIEnv, jobject)
-    EnsureLocalCapacity = ctypes.CFUNCTYPE(jint, JNIEnv, jint)
-    PushLocalFrame = ctypes.CFUNCTYPE(jint, JNIEnv, jint)
-    PopLocalFrame = ctypes.CFUNCTYPE(jobject, JNIEnv, jobject)
-    NewWeakGlobalRef = ctypes.CFUNCTYPE(c_void_p, JNIEnv, jobject)
-    DeleteWeakGlobalRef = ctypes.CFUNCTYPE(None, JNIEnv, c_void_p)
-    MonitorEnter = ctypes.CFUNCTYPE(jint, JNIEnv, jobject)
-    MonitorExit = ctypes.CFUNCTYPE(jint, JNIEnv, jobject)
-    GetJavaVM = ctypes.CFUNCTYPE(jint, JNIEnv, POINTER(JavaVM))
-    FromReflectedMethod = ctypes.CFUNCTYPE(jmethodID, JNIEnv, jobject)
-    FromReflectedField = ctypes.CFUNCTYPE(jfieldID, JNIEnv, jobject)
-    ToReflectedMethod = ctypes.CFUNCTYPE(jobject, JNIEnv, jclass, jmethodID, jboolean)
-    ToReflectedField = ctypes.CFUNCTYPE(jobject, JNIEnv, jclass, jfieldID, jboolean)
+    ReleaseStringChars = _cfunc(None, JNIEnv, jstring, POINTER(ctypes.c_uint16))
+    NewStringUTF = _cfunc(jstring, JNIEnv, c_char_p)
+    GetStringUTFLength = _cfunc(jsize, JNIEnv, jstring)
+    GetStringUTFChars = _cfunc(c_char_p, JNIEnv, jstring, POINTER(jboolean))
+    ReleaseStringUTFChars = _cfunc(None, JNIEnv, jstring, c_char_p)
+    GetArrayLength = _cfunc(jsize, JNIEnv, jarray)
+    NewObjectArray = _cfunc(jarray, JNIEnv, jsize, jclass, jobject)
+    GetObjectArrayElement = _cfunc(jobject, JNIEnv, jarray, jsize)
+    SetObjectArrayElement = _cfunc(None, JNIEnv, jarray, jsize, jobject)
+    Throw = _cfunc(jint, JNIEnv, jthrowable)
+    ThrowNew = _cfunc(jint, JNIEnv, jclass, c_char_p)
+    ExceptionOccurred = _cfunc(jthrowable, JNIEnv)
+    ExceptionDescribe = _cfunc(None, JNIEnv)
+    ExceptionClear = _cfunc(None, JNIEnv)
+    FatalError = _cfunc(None, JNIEnv, c_char_p)
+    ExceptionCheck = _cfunc(jboolean, JNIEnv)
+    NewGlobalRef = _cfunc(jobject, JNIEnv, jobject)
+    DeleteGlobalRef = _cfunc(None, JNIEnv, jobject)
+    DeleteLocalRef = _cfunc(None, JNIEnv, jobject)
+    NewLocalRef = _cfunc(jobject, JNIEnv, jobject)
+    EnsureLocalCapacity = _cfunc(jint, JNIEnv, jint)
+    PushLocalFrame = _cfunc(jint, JNIEnv, jint)
+    PopLocalFrame = _cfunc(jobject, JNIEnv, jobject)
+    NewWeakGlobalRef = _cfunc(c_void_p, JNIEnv, jobject)
+    DeleteWeakGlobalRef = _cfunc(None, JNIEnv, c_void_p)
+    MonitorEnter = _cfunc(jint, JNIEnv, jobject)
+    MonitorExit = _cfunc(jint, JNIEnv, jobject)
+    GetJavaVM = _cfunc(jint, JNIEnv, POINTER(JavaVM))
+    FromReflectedMethod = _cfunc(jmethodID, JNIEnv, jobject)
+    FromReflectedField = _cfunc(jfieldID, JNIEnv, jobject)
+    ToReflectedMethod = _cfunc(jobject, JNIEnv, jclass, jmethodID, jboolean)
+    ToReflectedField = _cfunc(jobject, JNIEnv, jclass, jfieldID, jboolean)
+
+
+# ctypes関数ポインタの共通基底（型スタブでは非公開扱い）
+_CFuncPtr = ctypes._CFuncPtr  # type: ignore[attr-defined]
+
+# JNIHelperが束縛する（属性名, テーブル添字, プロトタイプ）の一覧。
+# import時に一度だけ解決し、インスタンス生成時のgetattr連鎖を省く
+_JNI_BINDINGS = [
+    ("_fn_" + name, getattr(JNIFunctionIndices, name), proto)
+    for name, proto in vars(JNIPrototypes).items()
+    if isinstance(proto, type) and issubclass(proto, _CFuncPtr)
+]
+
+
+# 検証や引数変換を持たない素通しラッパーはテンプレートから生成する
+# （関数ポインタとenvをデフォルト引数に焼き込み、LOAD_FASTのみの最短経路にする）
+_WRAPPER_KINDS = {
+    "GetVersion": "plain",
+    "GetSuperclass": "plain",
+    "AllocObject": "plain",
+    "IsAssignableFrom": "bool",
+    "IsInstanceOf": "bool",
+    "IsSameObject": "bool",
+    "GetObjectField": "plain",
+    "GetIntField": "plain",
+    "GetLongField": "plain",
+    "GetArrayLength": "plain",
+    "GetObjectArrayElement": "plain",
+    "SetObjectArrayElement": "plain",
+    "ExceptionOccurred": "plain",
+    "ExceptionDescribe": "plain",
+    "ExceptionClear": "plain",
+    "ExceptionCheck": "bool",
+    "NewGlobalRef": "plain",
+    "DeleteGlobalRef": "plain",
+    "DeleteLocalRef": "plain",
+    "NewLocalRef": "plain",
+    "PopLocalFrame": "plain",
+    "NewWeakGlobalRef": "plain",
+    "DeleteWeakGlobalRef": "plain",
+    "Throw": "plain",
+    "MonitorEnter": "plain",
+    "MonitorExit": "plain",
+    "EnsureLocalCapacity": "plain",
+    "PushLocalFrame": "plain",
+    "GetJavaVM": "plain",
+    "GetStringLength": "plain",
+    "GetStringUTFLength": "plain",
+}
+
+
+def _compile_wrappers() -> list[tuple[str, Any]]:
+    """素通しラッパーのコードオブジェクトをimport時に一度だけ生成"""
+    compiled = []
+    prototypes = vars(JNIPrototypes)
+    for name, kind in _WRAPPER_KINDS.items():
+        arg_count = len(prototypes[name]._argtypes_) - 1  # 先頭はJNIEnv
+        params = "".join(f"a{i}, " for i in range(arg_count))
+        call = "".join(f", a{i}" for i in range(arg_count))
+        suffix = " != 0" if kind == "bool" else ""
+        source = (
+            f"def {name}({params}_fn=_fn, _env=_env):\n"
+            f"    return _fn(_env{call}){suffix}\n"
+        )
+        compiled.append((name, compile(source, "<jni-wrapper>", "exec")))
+    return compiled
+
+
+_COMPILED_WRAPPERS = _compile_wrappers()
+
+# NULL戻りが例外起因か否かをerrcheckで自動判定する参照生成系
+_ERRCHECK_BOUND = (
+    "NewObjectArray",
+    "GetObjectArrayElement",
+    "NewLocalRef",
+    "NewGlobalRef",
+    "NewWeakGlobalRef",
+)
 
 
 class JNIHelper:
     """JNI関数呼び出しヘルパー"""
 
+    # 少数引数呼び出し用スクラッチバッファのスロット数
+    _SCRATCH_SLOTS = 4
+    # jstringキャッシュの上限（超過時は最古の1件のみ退避する）
+    _UTF_CACHE_MAX = 256
+
+    # _bind_functions()が実行時にsetattrで束縛する属性の宣言
+    # （logger.pyと同じパターン。mypyに動的束縛後の型面を見せる）
+    _fn_GetVersion: Callable[..., Any]
+    _fn_DefineClass: Callable[..., Any]
+    _fn_FindClass: Callable[..., Any]
+    _fn_GetSuperclass: Callable[..., Any]
+    _fn_IsAssignableFrom: Callable[..., int]
+    _fn_AllocObject: Callable[..., Any]
+    _fn_NewObject: Callable[..., Any]
+    _fn_NewObjectV: Callable[..., Any]
+    _fn_NewObjectA: Callable[..., Any]
+    _fn_GetObjectClass: Callable[..., Any]
+    _fn_IsInstanceOf: Callable[..., int]
+    _fn_IsSameObject: Callable[..., int]
+    _fn_GetMethodID: Callable[..., Any]
+    _fn_CallObjectMethod: Callable[..., Any]
+    _fn_CallObjectMethodV: Callable[..., Any]
+    _fn_CallObjectMethodA: Callable[..., Any]
+    _fn_CallBooleanMethod: Callable[..., int]
+    _fn_CallIntMethod: Callable[..., int]
+    _fn_CallVoidMethod: Callable[..., Any]
+    _fn_CallVoidMethodA: Callable[..., Any]
+    _fn_GetStaticMethodID: Callable[..., Any]
+    _fn_CallStaticObjectMethod: Callable[..., Any]
+    _fn_CallStaticObjectMethodV: Callable[..., Any]
+    _fn_CallStaticObjectMethodA: Callable[..., Any]
+    _fn_CallStaticVoidMethod: Callable[..., Any]
+    _fn_CallStaticVoidMethodV: Callable[..., Any]
+    _fn_CallStaticVoidMethodA: Callable[..., Any]
+    _fn_GetFieldID: Callable[..., Any]
+    _fn_GetObjectField: Callable[..., Any]
+    _fn_GetIntField: Callable[..., Any]
+    _fn_GetLongField: Callable[..., Any]
+    _fn_SetObjectField: Callable[..., Any]
+    _fn_GetStaticFieldID: Callable[..., Any]
+    _fn_GetStaticObjectField: Callable[..., Any]
+    _fn_SetStaticObjectField: Callable[..., Any]
+    _fn_NewString: Callable[..., Any]
+    _fn_GetStringLength: Callable[..., int]
+    _fn_GetStringChars: Callable[..., Any]
+    _fn_ReleaseStringChars: Callable[..., Any]
+    _fn_NewStringUTF: Callable[..., Any]
+    _fn_GetStringUTFLength: Callable[..., int]
+    _fn_GetStringUTFChars: Callable[..., Any]
+    _fn_ReleaseStringUTFChars: Callable[..., Any]
+    _fn_GetArrayLength: Callable[..., int]
+    _fn_NewObjectArray: Callable[..., Any]
+    _fn_GetObjectArrayElement: Callable[..., Any]
+    _fn_SetObjectArrayElement: Callable[..., Any]
+    _fn_Throw: Callable[..., Any]
+    _fn_ThrowNew: Callable[..., int]
+    _fn_ExceptionOccurred: Callable[..., Any]
+    _fn_ExceptionDescribe: Callable[..., Any]
+    _fn_ExceptionClear: Callable[..., Any]
+    _fn_FatalError: Callable[..., Any]
+    _fn_ExceptionCheck: Callable[..., int]
+    _fn_NewGlobalRef: Callable[..., Any]
+    _fn_DeleteGlobalRef: Callable[..., Any]
+    _fn_DeleteLocalRef: Callable[..., Any]
+    _fn_NewLocalRef: Callable[..., Any]
+    _fn_EnsureLocalCapacity: Callable[..., Any]
+    _fn_PushLocalFrame: Callable[..., Any]
+    _fn_PopLocalFrame: Callable[..., Any]
+    _fn_NewWeakGlobalRef: Callable[..., Any]
+    _fn_DeleteWeakGlobalRef: Callable[..., Any]
+    _fn_MonitorEnter: Callable[..., Any]
+    _fn_MonitorExit: Callable[..., Any]
+    _fn_GetJavaVM: Callable[..., Any]
+    _fn_FromReflectedMethod: Callable[..., Any]
+    _fn_FromReflectedField: Callable[..., Any]
+    _fn_ToReflectedMethod: Callable[..., Any]
+    _fn_ToReflectedField: Callable[..., Any]
+    # _COMPILED_WRAPPERSから生成される素通しラッパー
+    GetVersion: Callable[..., Any]
+    GetSuperclass: Callable[..., Any]
+    AllocObject: Callable[..., Any]
+    IsAssignableFrom: Callable[..., bool]
+    IsInstanceOf: Callable[..., bool]
+    IsSameObject: Callable[..., bool]
+    GetObjectField: Callable[..., Any]
+    GetIntField: Callable[..., Any]
+    GetLongField: Callable[..., Any]
+    GetArrayLength: Callable[..., int]
+    GetObjectArrayElement: Callable[..., Any]
+    SetObjectArrayElement: Callable[..., Any]
+    ExceptionOccurred: Callable[..., Any]
+    ExceptionDescribe: Callable[..., Any]
+    ExceptionClear: Callable[..., Any]
+    ExceptionCheck: Callable[..., bool]
+    NewGlobalRef: Callable[..., Any]
+    DeleteGlobalRef: Callable[..., Any]
+    DeleteLocalRef: Callable[..., Any]
+    NewLocalRef: Callable[..., Any]
+    PopLocalFrame: Callable[..., Any]
+    NewWeakGlobalRef: Callable[..., Any]
+    DeleteWeakGlobalRef: Callable[..., Any]
+    Throw: Callable[..., Any]
+    MonitorEnter: Callable[..., Any]
+    MonitorExit: Callable[..., Any]
+    EnsureLocalCapacity: Callable[..., Any]
+    PushLocalFrame: Callable[..., Any]
+    GetJavaVM: Callable[..., Any]
+    GetStringLength: Callable[..., int]
+    GetStringUTFLength: Callable[..., int]
+    raw: types.SimpleNamespace
+
     def __init__(self, env: Any) -> None:
         self.env = env
         self._function_table = self._get_function_table()
+        # 関数ポインタはJNIEnvの生存期間中不変なので一度だけ読み取る
+        table_size = JNIFunctionIndices.GetObjectRefType + 1
+        self._fn_ptrs = [self._function_table[i] or 0 for i in range(table_size)]
+        # JNIEnv同様スレッド毎に独立させる
+        self._scratch = threading.local()
+        self._utf_cache: OrderedDict[str, Any] = OrderedDict()
+        self._method_id_cache: dict[tuple[Any, str, str], Any] = {}
+        # opt-inグローバル参照インターン用（対象アドレス -> [ref, 参照数]）
+        self._global_ref_cache: dict[Any, list[Any]] = {}
+        self._global_ref_index: dict[Any, Any] = {}
+        # リフレクション変換結果（クラス生存中は安定）のキャッシュ
+        self._reflected_cache: dict[tuple[Any, Any, bool], Any] = {}
+        self._pending_deletes: list[Any] = []
+        # ThrowNew/FatalError用メッセージスクラッチ（ctypes変換の都度確保を回避）
+        self._msg_scratch = ctypes.create_string_buffer(4096)
+        self._bind_functions()
+        # 例外チェック最速経路（Cコール1回+分岐1回）用の束縛
+        self._chk = self._fn_ExceptionCheck
+
+    def _bind_functions(self) -> None:
+        """JNI関数ポインタを一度だけ束縛（呼び出し毎のcast/CFUNCTYPE生成を排除）"""
+        ptrs = self._fn_ptrs
+        # 属性束縛に加え、整数添字で引ける連続テーブルも用意する
+        self._fns: list[Any] = [None] * len(ptrs)
+        for attr, index, prototype in _JNI_BINDINGS:
+            bound = prototype(ptrs[index])
+            setattr(self, attr, bound)
+            self._fns[index] = bound
+
+        # 参照生成系はctypesのerrcheckで例外検出を畳み込む
+        # （NULL戻り + 例外保留のときだけ低速経路へ）
+        chk = self._fn_ExceptionCheck
+        env = self.env
+        handle = self._handle_exception
+
+        def _errcheck(result: Any, func: Any, args: Any) -> Any:
+            if result is None and chk(env):
+                handle()
+            return result
+
+        for name in _ERRCHECK_BOUND:
+            getattr(self, "_fn_" + name).errcheck = _errcheck
+
+        # JITコンパイル済みコード（numba等はctypes関数を直接呼べる）向けの
+        # 生エントリポイント。Pythonラッパーを経由せずJNIへ到達できる
+        self.raw = types.SimpleNamespace(
+            env_address=ctypes.cast(self.env, c_void_p).value,
+            get_object_array_element=self._fn_GetObjectArrayElement,
+            set_object_array_element=self._fn_SetObjectArrayElement,
+            delete_local_ref=self._fn_DeleteLocalRef,
+            exception_check=self._fn_ExceptionCheck,
+        )
+
+        # 素通しラッパーをインスタンス毎に生成して束縛
+        for name, code in _COMPILED_WRAPPERS:
+            namespace = {"_fn": getattr(self, "_fn_" + name), "_env": self.env}
+            exec(code, namespace)
+            setattr(self, name, namespace[name])
 
     def _check_exception(self) -> None:
         """例外チェックとクリア"""
-        if self.ExceptionCheck():
-            self.ExceptionDescribe()
-            self.ExceptionClear()
-            raise RuntimeError("JNI exception occurred")
+        # 例外なしが圧倒的多数派なので束縛済みポインタを直接叩く
+        if self._chk(self.env):
+            self._handle_exception()
+
+    def _handle_exception(self) -> None:
+        """例外発生時の低速経路（記述・クリア・送出）"""
+        self.ExceptionDescribe()
+        self.ExceptionClear()
+        raise RuntimeError("JNI exception occurred")
 
     def _get_function_table(self) -> Any:
         """JNI関数テーブル取得"""
@@ -460,194 +780,240 @@ class JNIHelper:
 
     def _get_function(self, index: int, prototype: Any) -> Any:
         """JNI関数取得"""
-        return prototype(self._function_table[index])
+        return prototype(self._fn_ptrs[index])
 
-    def GetVersion(self) -> int:
-        func = self._get_function(
-            JNIFunctionIndices.GetVersion, JNIPrototypes.GetVersion
-        )
-        return cast(int, func(self.env))
+    def _args_ptr(self, args: tuple[Any, ...]) -> Any:
+        """引数をjvalueポインタへ変換（4個以下はスクラッチバッファを再利用）"""
+        n = len(args)
+        if n <= self._SCRATCH_SLOTS:
+            local = self._scratch
+            try:
+                buf = local.buf
+                ptr = local.ptr
+            except AttributeError:
+                buf = (ctypes.c_ubyte * (_JVALUE_SIZE * self._SCRATCH_SLOTS))()
+                ptr = ctypes.cast(buf, POINTER(jvalue))
+                local.buf = buf
+                local.ptr = ptr
+            ctypes.memset(buf, 0, _JVALUE_SIZE * n)
+            _fill_jvalue_buffer(buf, args)
+            return ptr
+
+        jvalue_array, _ = _convert_args_to_jvalue_array(args)
+        return ctypes.cast(jvalue_array, POINTER(jvalue))
 
     def FindClass(self, name: str) -> Optional[Any]:
-        func = self._get_function(JNIFunctionIndices.FindClass, JNIPrototypes.FindClass)
-        result = func(self.env, name.encode("utf-8"))
-        self._check_exception()
+        result = self._fn_FindClass(self.env, _utf8(name))
+        if self._chk(self.env):
+            self._handle_exception()
         return result
 
-    def GetSuperclass(self, clazz: Any) -> Optional[Any]:
-        func = self._get_function(
-            JNIFunctionIndices.GetSuperclass, JNIPrototypes.GetSuperclass
-        )
-        return func(self.env, clazz)
-
-    def IsAssignableFrom(self, clazz1: Any, clazz2: Any) -> bool:
-        func = self._get_function(
-            JNIFunctionIndices.IsAssignableFrom, JNIPrototypes.IsAssignableFrom
-        )
-        return bool(func(self.env, clazz1, clazz2))
-
-    def AllocObject(self, clazz: Any) -> Optional[Any]:
-        func = self._get_function(
-            JNIFunctionIndices.AllocObject, JNIPrototypes.AllocObject
-        )
-        return func(self.env, clazz)
-
     def NewObject(self, clazz: Any, method_id: Any, *args: Any) -> Optional[Any]:
-        func = self._get_function(JNIFunctionIndices.NewObject, JNIPrototypes.NewObject)
-        return func(self.env, clazz, method_id, *args)
+        return self._fn_NewObject(self.env, clazz, method_id, *args)
 
     def GetObjectClass(self, obj: Any) -> Optional[Any]:
-        if not obj:
-            raise ValueError("obj must not be NULL")
-        func = self._get_function(
-            JNIFunctionIndices.GetObjectClass, JNIPrototypes.GetObjectClass
-        )
-        result = func(self.env, obj)
-        self._check_exception()
+        if __debug__:
+            if not obj:
+                raise ValueError("obj must not be NULL")
+        result = self._fn_GetObjectClass(self.env, obj)
+        if self._chk(self.env):
+            self._handle_exception()
         return result
 
-    def IsInstanceOf(self, obj: Any, clazz: Any) -> bool:
-        func = self._get_function(
-            JNIFunctionIndices.IsInstanceOf, JNIPrototypes.IsInstanceOf
-        )
-        return bool(func(self.env, obj, clazz))
-
-    def IsSameObject(self, obj1: Any, obj2: Any) -> bool:
-        func = self._get_function(
-            JNIFunctionIndices.IsSameObject, JNIPrototypes.IsSameObject
-        )
-        return bool(func(self.env, obj1, obj2))
-
     # Method Operations
     def GetMethodID(self, clazz: Any, name: str, signature: str) -> Optional[Any]:
         """Get method ID"""
-        if not clazz:
-            raise ValueError("clazz must not be NULL")
-        func = self._get_function(
-            JNIFunctionIndices.GetMethodID, JNIPrototypes.GetMethodID
-        )
-        result = func(self.env, clazz, name.encode("utf-8"), signature.encode("utf-8"))
-        self._check_exception()
+        if __debug__:
+            if not clazz:
+                raise ValueError("clazz must not be NULL")
+        result = self._fn_GetMethodID(self.env, clazz, _utf8(name), _utf8(signature))
+        if self._chk(self.env):
+            self._handle_exception()
         return result
 
     def CallObjectMethodA(self, obj: Any, method_id: Any, args: Any) -> Optional[Any]:
         """Call object method with jvalue argument array"""
-        func = self._get_function(
-            JNIFunctionIndices.CallObjectMethodA, JNIPrototypes.CallObjectMethodA
-        )
         # Pass args as a pointer to the first element for JNI compatibility
         args_ptr = ctypes.cast(args, POINTER(jvalue)) if args else None
-        result = func(self.env, obj, method_id, args_ptr)
-        self._check_exception()
+        result = self._fn_CallObjectMethodA(self.env, obj, method_id, args_ptr)
+        if self._chk(self.env):
+            self._handle_exception()
+        return result
+
+    def CallObjectMethod0(self, obj: Any, method_id: Any) -> Optional[Any]:
+        """引数なし呼び出し特化版（可変長引数の梱包と分岐を省く）"""
+        result = self._fn_CallObjectMethod(self.env, obj, method_id)
+        if self._chk(self.env):
+            self._handle_exception()
+        return result
+
+    def CallVoidMethod0(self, obj: Any, method_id: Any) -> None:
+        """引数なしvoid呼び出し特化版"""
+        self._fn_CallVoidMethod(self.env, obj, method_id)
+        if self._chk(self.env):
+            self._handle_exception()
+
+    def CallStaticObjectMethod0(self, clazz: Any, method_id: Any) -> Optional[Any]:
+        """引数なし静的呼び出し特化版"""
+        result = self._fn_CallStaticObjectMethod(self.env, clazz, method_id)
+        if self._chk(self.env):
+            self._handle_exception()
         return result
 
     def CallObjectMethod(self, obj: Any, method_id: Any, *args: Any) -> Optional[Any]:
         """Call object method - uses jvalue array for safe argument passing"""
+        return self._call_object(obj, method_id, args)
+
+    def call_object(
+        self, obj: Any, clazz: Any, name: str, sig: str, args: tuple[Any, ...] = ()
+    ) -> Optional[Any]:
+        """メソッドID解決込みの呼び出し（IDは(クラス, 名前, シグネチャ)でキャッシュ）
+
+        clazzにはグローバル参照を渡すこと。ローカル参照が回収されると
+        キャッシュ済みIDが古くなる。
+        """
+        key = ((clazz if isinstance(clazz, int) else clazz.value), name, sig)
+        method_id = self._method_id_cache.get(key)
+        if method_id is None:
+            method_id = self.GetMethodID(clazz, name, sig)
+            if not method_id:
+                raise RuntimeError(f"MethodID resolve failed for {name}{sig}")
+            self._method_id_cache[key] = method_id
+        return self._call_object(obj, method_id, args)
+
+    def call_static_object_batch(
+        self,
+        clazz: Any,
+        method_id: Any,
+        args_iter: Any,
+    ) -> list[Any]:
+        """同一静的メソッドの反復呼び出しをPython側1エントリに集約
+
+        例外チェックは毎回行う。保留例外中に次のメソッド呼び出しを
+        発行することはJNI仕様で禁止されているため間引けない
+        (ExceptionCheck自体はFFI1往復の安価な呼び出し)。
+        """
+        fn = self._fn_CallStaticObjectMethodA
+        env = self.env
+        chk = self._chk
+        args_ptr = self._args_ptr
+        results: list[Any] = []
+        append = results.append
+        for args in args_iter:
+            append(fn(env, clazz, method_id, args_ptr(args) if args else None))
+            if chk(env):
+                self._handle_exception()
+        return results
+
+    def call_static_object(
+        self, clazz: Any, name: str, sig: str, args: tuple[Any, ...] = ()
+    ) -> Optional[Any]:
+        """静的メソッドID解決込みの呼び出し（IDキャッシュはcall_objectと共用）"""
+        key = ((clazz if isinstance(clazz, int) else clazz.value), name, sig)
+        method_id = self._method_id_cache.get(key)
+        if method_id is None:
+            method_id = self.GetStaticMethodID(clazz, name, sig)
+            if not method_id:
+                raise RuntimeError(f"MethodID resolve failed for {name}{sig}")
+            self._method_id_cache[key] = method_id
+        return self._call_static_object(clazz, method_id, args)
+
+    def _call_object(
+        self, obj: Any, method_id: Any, args: tuple[Any, ...] = ()
+    ) -> Optional[Any]:
+        """タプル受け本体（呼び出し毎のタプル再梱包を避けたい側はこちら）"""
         if not args:
             # No arguments - use direct call
-            func = self._get_function(
-                JNIFunctionIndices.CallObjectMethod, JNIPrototypes.CallObjectMethod
-            )
-            result = func(self.env, obj, method_id)
-            self._check_exception()
-            return result
+            result = self._fn_CallObjectMethod(self.env, obj, method_id)
         else:
             # With arguments - use array version
-            jvalue_array, _ = _convert_args_to_jvalue_array(args)
-            return self.CallObjectMethodA(obj, method_id, jvalue_array)
+            result = self._fn_CallObjectMethodA(
+                self.env, obj, method_id, self._args_ptr(args)
+            )
+        if self._chk(self.env):
+            self._handle_exception()
+        return result
 
     def CallBooleanMethod(self, obj: Any, method_id: Any, *args: Any) -> bool:
         """Call boolean method"""
-        func = self._get_function(
-            JNIFunctionIndices.CallBooleanMethod, JNIPrototypes.CallBooleanMethod
-        )
-        return bool(func(self.env, obj, method_id, *args))
+        return self._fn_CallBooleanMethod(self.env, obj, method_id, *args) != 0
 
     def CallIntMethod(self, obj: Any, method_id: Any, *args: Any) -> int:
         """Call int method"""
-        func = self._get_function(
-            JNIFunctionIndices.CallIntMethod, JNIPrototypes.CallIntMethod
-        )
-        return int(func(self.env, obj, method_id, *args))
+        return int(self._fn_CallIntMethod(self.env, obj, method_id, *args))
 
     def CallVoidMethod(self, obj: Any, method_id: Any, *args: Any) -> None:
         """Call void method - uses jvalue array for safe argument passing"""
-        if not obj:
-            raise ValueError("obj must not be NULL")
-        if not method_id:
-            raise ValueError("method_id must not be NULL")
+        self._call_void(obj, method_id, args)
+
+    def _call_void(self, obj: Any, method_id: Any, args: tuple[Any, ...] = ()) -> None:
+        """タプル受け本体"""
+        if __debug__:
+            if not obj:
+                raise ValueError("obj must not be NULL")
+        if __debug__:
+            if not method_id:
+                raise ValueError("method_id must not be NULL")
 
         if not args:
             # No arguments - use direct call
-            func = self._get_function(
-                JNIFunctionIndices.CallVoidMethod, JNIPrototypes.CallVoidMethod
-            )
-            func(self.env, obj, method_id)
+            self._fn_CallVoidMethod(self.env, obj, method_id)
         else:
             # With arguments - use array version
-            func = self._get_function(
-                JNIFunctionIndices.CallVoidMethodA, JNIPrototypes.CallVoidMethodA
-            )
-            jvalue_array, _ = _convert_args_to_jvalue_array(args)
-            args_ptr = (
-                ctypes.cast(jvalue_array, POINTER(jvalue)) if jvalue_array else None
-            )
-            func(self.env, obj, method_id, args_ptr)
+            self._fn_CallVoidMethodA(self.env, obj, method_id, self._args_ptr(args))
 
-        self._check_exception()
+        if self._chk(self.env):
+            self._handle_exception()
 
     def GetStaticMethodID(self, clazz: Any, name: str, signature: str) -> Optional[Any]:
         """Get static method ID"""
-        func = self._get_function(
-            JNIFunctionIndices.GetStaticMethodID, JNIPrototypes.GetStaticMethodID
+        return self._fn_GetStaticMethodID(
+            self.env, clazz, _utf8(name), _utf8(signature)
         )
-        return func(self.env, clazz, name.encode("utf-8"), signature.encode("utf-8"))
 
     def CallStaticObjectMethodA(
         self, clazz: Any, method_id: Any, args: Any
     ) -> Optional[Any]:
         """Call static object method with jvalue argument array"""
-        func = self._get_function(
-            JNIFunctionIndices.CallStaticObjectMethodA,
-            JNIPrototypes.CallStaticObjectMethodA,
-        )
 
-        # Validate and convert arguments
         if args is None:
             args_ptr = None
         else:
-            # Verify alignment on ARM64 macOS for safety
-            if platform.system() == "Darwin" and platform.machine() == "arm64":
-                args_addr = ctypes.addressof(args)
-                if args_addr % 8 != 0:
-                    logger.error(f"jvalue array misaligned on ARM64: {args_addr:#x}")
-                    raise RuntimeError(
-                        f"jvalue array misaligned on ARM64: {args_addr:#x} (must be 8-byte aligned)"
-                    )
+            if __debug__ and _IS_DARWIN_ARM64:
+                assert ctypes.addressof(args) % 8 == 0, "jvalue array misaligned"
 
             args_ptr = ctypes.cast(args, POINTER(jvalue))
 
-        result = func(self.env, clazz, method_id, args_ptr)
-        self._check_exception()
+        result = self._fn_CallStaticObjectMethodA(self.env, clazz, method_id, args_ptr)
+        if self._chk(self.env):
+            self._handle_exception()
         return result
 
     def CallStaticObjectMethod(
         self, clazz: Any, method_id: Any, *args: Any
     ) -> Optional[Any]:
         """Call static object method with proper resource management"""
-        frame_capacity = max(10, len(args) * 2)
-        if self.PushLocalFrame(frame_capacity) != 0:
+        return self._call_static_object(clazz, method_id, args)
+
+    def _call_static_object(
+        self, clazz: Any, method_id: Any, args: tuple[Any, ...] = ()
+    ) -> Optional[Any]:
+        """タプル受け本体"""
+        if not args:
+            return self._call_static_method_no_args(clazz, method_id)
+
+        str_count = sum(1 for arg in args if type(arg) is str)
+        if str_count == 0:
+            # ローカルフレームはNewStringUTFの一時参照回収専用なので不要
+            return self._call_static_method_with_args(clazz, method_id, list(args))
+
+        if self.PushLocalFrame(str_count + 2) != 0:
             raise RuntimeError("Failed to push local frame")
 
         result = None
         try:
             jni_args = self._convert_python_args_to_jni(args)
-
-            if not jni_args:
-                result = self._call_static_method_no_args(clazz, method_id)
-            else:
-                result = self._call_static_method_with_args(clazz, method_id, jni_args)
-
+            result = self._call_static_method_with_args(clazz, method_id, jni_args)
         finally:
             result = self.PopLocalFrame(result)
 
@@ -668,27 +1034,23 @@ class JNIHelper:
 
     def _call_static_method_no_args(self, clazz: Any, method_id: Any) -> Optional[Any]:
         """Call static method with no arguments"""
-        func = self._get_function(
-            JNIFunctionIndices.CallStaticObjectMethod,
-            JNIPrototypes.CallStaticObjectMethod,
-        )
-        result = func(self.env, clazz, method_id)
-        self._check_exception()
+        result = self._fn_CallStaticObjectMethod(self.env, clazz, method_id)
+        if self._chk(self.env):
+            self._handle_exception()
         return result
 
     def _call_static_method_with_args(
         self, clazz: Any, method_id: Any, jni_args: list[Any]
     ) -> Optional[Any]:
         """Call static method with multiple arguments"""
-        jvalue_array, _ = _convert_args_to_jvalue_array(tuple(jni_args))
-        return self.CallStaticObjectMethodA(clazz, method_id, jvalue_array)
+        args_ptr = self._args_ptr(tuple(jni_args))
+        result = self._fn_CallStaticObjectMethodA(self.env, clazz, method_id, args_ptr)
+        if self._chk(self.env):
+            self._handle_exception()
+        return result
 
     def CallStaticVoidMethodA(self, clazz: Any, method_id: Any, args: Any) -> None:
         """Call static void method with jvalue argument array"""
-        func = self._get_function(
-            JNIFunctionIndices.CallStaticVoidMethodA,
-            JNIPrototypes.CallStaticVoidMethodA,
-        )
 
         # Validate and convert arguments
         if args is None:
@@ -696,106 +1058,139 @@ class JNIHelper:
         else:
             args_ptr = ctypes.cast(args, POINTER(jvalue))
 
-        func(self.env, clazz, method_id, args_ptr)
-        self._check_exception()
+        self._fn_CallStaticVoidMethodA(self.env, clazz, method_id, args_ptr)
+        if self._chk(self.env):
+            self._handle_exception()
 
     # Field Operations
     def GetFieldID(self, clazz: Any, name: str, signature: str) -> Optional[Any]:
         """Get field ID"""
-        func = self._get_function(
-            JNIFunctionIndices.GetFieldID, JNIPrototypes.GetFieldID
-        )
-        return func(self.env, clazz, name.encode("utf-8"), signature.encode("utf-8"))
-
-    def GetObjectField(self, obj: Any, field_id: Any) -> Optional[Any]:
-        """Get object field"""
-        func = self._get_function(
-            JNIFunctionIndices.GetObjectField, JNIPrototypes.GetObjectField
-        )
-        return func(self.env, obj, field_id)
+        return self._fn_GetFieldID(self.env, clazz, _utf8(name), _utf8(signature))
+
+    def get_int_fields_batch(self, obj: Any, field_ids: list[Any]) -> list[int]:
+        """複数intフィールドを一括取得（Python側のディスパッチを1回に集約）"""
+        fn = self._fn_GetIntField
+        env = self.env
+        values = [fn(env, obj, field_id) for field_id in field_ids]
+        if self._chk(self.env):
+            self._handle_exception()
+        return values
+
+    def get_long_fields_batch(self, obj: Any, field_ids: list[Any]) -> list[int]:
+        """複数longフィールドを一括取得"""
+        fn = self._fn_GetLongField
+        env = self.env
+        values = [fn(env, obj, field_id) for field_id in field_ids]
+        if self._chk(self.env):
+            self._handle_exception()
+        return values
 
     def SetObjectField(self, obj: Any, field_id: Any, value: Any) -> None:
         """Set object field"""
-        func = self._get_function(
-            JNIFunctionIndices.SetObjectField, JNIPrototypes.SetObjectField
-        )
-        func(self.env, obj, field_id, value)
+        self._fn_SetObjectField(self.env, obj, field_id, value)
 
     def GetStaticFieldID(self, clazz: Any, name: str, signature: str) -> Optional[Any]:
         """Get static field ID"""
-        if not clazz:
-            raise ValueError("clazz must not be NULL")
-        func = self._get_function(
-            JNIFunctionIndices.GetStaticFieldID, JNIPrototypes.GetStaticFieldID
+        if __debug__:
+            if not clazz:
+                raise ValueError("clazz must not be NULL")
+        result = self._fn_GetStaticFieldID(
+            self.env, clazz, _utf8(name), _utf8(signature)
         )
-        result = func(self.env, clazz, name.encode("utf-8"), signature.encode("utf-8"))
-        self._check_exception()
+        if self._chk(self.env):
+            self._handle_exception()
         return result
 
     def GetStaticObjectField(self, clazz: Any, field_id: Any) -> Optional[Any]:
         """Get static object field"""
-        if not clazz:
-            raise ValueError("clazz must not be NULL")
-        if not field_id:
-            raise ValueError("field_id must not be NULL")
-        func = self._get_function(
-            JNIFunctionIndices.GetStaticObjectField, JNIPrototypes.GetStaticObjectField
-        )
-        result = func(self.env, clazz, field_id)
-        self._check_exception()
+        if __debug__:
+            if not clazz:
+                raise ValueError("clazz must not be NULL")
+        if __debug__:
+            if not field_id:
+                raise ValueError("field_id must not be NULL")
+        result = self._fn_GetStaticObjectField(self.env, clazz, field_id)
+        if self._chk(self.env):
+            self._handle_exception()
         return result
 
     def SetStaticObjectField(self, clazz: Any, field_id: Any, value: Any) -> None:
         """Set static object field"""
-        func = self._get_function(
-            JNIFunctionIndices.SetStaticObjectField, JNIPrototypes.SetStaticObjectField
-        )
-        func(self.env, clazz, field_id, value)
+        self._fn_SetStaticObjectField(self.env, clazz, field_id, value)
 
     # String Operations
     def NewString(self, unicode_chars: Any, length: int) -> Optional[Any]:
         """Create new string from unicode characters"""
-        func = self._get_function(JNIFunctionIndices.NewString, JNIPrototypes.NewString)
-        return func(self.env, unicode_chars, length)
-
-    def GetStringLength(self, string: Any) -> int:
-        """Get string length"""
-        func = self._get_function(
-            JNIFunctionIndices.GetStringLength, JNIPrototypes.GetStringLength
-        )
-        return cast(int, func(self.env, string))
+        return self._fn_NewString(self.env, unicode_chars, length)
 
     def GetStringChars(
         self, string: Any, is_copy: Optional[Any] = None
     ) -> Optional[Any]:
         """Get string characters"""
-        func = self._get_function(
-            JNIFunctionIndices.GetStringChars, JNIPrototypes.GetStringChars
-        )
-        return func(self.env, string, is_copy)
+        return self._fn_GetStringChars(self.env, string, is_copy)
 
     def ReleaseStringChars(self, string: Any, chars: Any) -> None:
         """Release string characters"""
-        func = self._get_function(
-            JNIFunctionIndices.ReleaseStringChars, JNIPrototypes.ReleaseStringChars
-        )
-        func(self.env, string, chars)
+        self._fn_ReleaseStringChars(self.env, string, chars)
 
     def NewStringUTF(self, utf_chars: str) -> Optional[Any]:
-        """UTF-8文字列から新しい文字列を作成"""
-        func = self._get_function(
-            JNIFunctionIndices.NewStringUTF, JNIPrototypes.NewStringUTF
-        )
-        result = func(self.env, utf_chars.encode("utf-8"))
-        self._check_exception()
-        return result
+        """UTF-8文字列から新しい文字列を作成（グローバル参照でLRUキャッシュ）
+
+        溢れた場合は最も古い1件だけを解放する。直近に返した参照は
+        LRU末尾に居るため、呼び出し側が使用中のjstringを巻き込む
+        全クリアのような解放は起きない。
+        """
+        cache = self._utf_cache
+        cached = cache.get(utf_chars)
+        if cached is not None:
+            cache.move_to_end(utf_chars)
+            return cached
+
+        result = self._fn_NewStringUTF(self.env, _utf8(utf_chars))
+        if self._chk(self.env):
+            self._handle_exception()
+        if result is None:
+            return None
 
-    def GetStringUTFLength(self, string: Any) -> int:
-        """Get UTF-8 string length"""
-        func = self._get_function(
-            JNIFunctionIndices.GetStringUTFLength, JNIPrototypes.GetStringUTFLength
-        )
-        return cast(int, func(self.env, string))
+        global_ref = self.NewGlobalRef(result)
+        if global_ref is None:
+            return result
+
+        self.DeleteLocalRef(result)
+        if len(cache) >= self._UTF_CACHE_MAX:
+            _, oldest_ref = cache.popitem(last=False)
+            try:
+                self.DeleteGlobalRef(oldest_ref)
+            except Exception:
+                pass
+        cache[utf_chars] = global_ref
+        return global_ref
+
+    def clear_string_cache(self) -> None:
+        """キャッシュ済みjstringのグローバル参照を解放 (シャットダウン用)"""
+        cache = self._utf_cache
+        self._utf_cache = OrderedDict()
+        for global_ref in cache.values():
+            try:
+                self.DeleteGlobalRef(global_ref)
+            except Exception:
+                pass
+
+    def GetStringUTFBytes(self, string: Any) -> Optional[bytes]:
+        """UTF-8バイト列を直接取得（デコード不要な比較用途向け）"""
+        if not string:
+            return None
+        char_ptr = self._fn_GetStringUTFChars(self.env, string, None)
+        if self._chk(self.env):
+            self._handle_exception()
+        if not char_ptr:
+            return None
+        try:
+            # 長さを先に取得してstring_atのNUL走査を省く
+            length = self._fn_GetStringUTFLength(self.env, string)
+            return _string_at(char_ptr, length)
+        finally:
+            self._fn_ReleaseStringUTFChars(self.env, string, char_ptr)
 
     def GetStringUTFChars(
         self, string: Any, is_copy: Optional[Any] = None
@@ -803,225 +1198,265 @@ class JNIHelper:
         """Get UTF-8 string characters"""
         if not string:
             return None
-        func = self._get_function(
-            JNIFunctionIndices.GetStringUTFChars, JNIPrototypes.GetStringUTFChars
-        )
-        char_ptr = func(self.env, string, is_copy)
-        self._check_exception()
+        char_ptr = self._fn_GetStringUTFChars(self.env, string, is_copy)
+        if self._chk(self.env):
+            self._handle_exception()
         if char_ptr:
             try:
-                import ctypes
-
-                # JNI GetStringUTFChars returns a pointer to null-terminated UTF-8 string
-                # Use string_at to read the entire null-terminated string
-                result_bytes = ctypes.string_at(char_ptr)
-                return result_bytes.decode("utf-8")
+                length = self._fn_GetStringUTFLength(self.env, string)
+                return _string_at(char_ptr, length).decode("utf-8")
             except (UnicodeDecodeError, AttributeError, TypeError):
                 return None
         return None
 
     def ReleaseStringUTFChars(self, string: Any, utf_chars: Any) -> None:
         """Release UTF-8 string characters"""
-        func = self._get_function(
-            JNIFunctionIndices.ReleaseStringUTFChars,
-            JNIPrototypes.ReleaseStringUTFChars,
-        )
-        func(self.env, string, utf_chars)
+        self._fn_ReleaseStringUTFChars(self.env, string, utf_chars)
 
     # Array Operations
-    def GetArrayLength(self, array: Any) -> int:
-        """Get array length"""
-        func = self._get_function(
-            JNIFunctionIndices.GetArrayLength, JNIPrototypes.GetArrayLength
-        )
-        return cast(int, func(self.env, array))
-
     def NewObjectArray(
         self, length: int, element_class: Any, initial_element: Any
     ) -> Optional[Any]:
         """Create new object array"""
-        func = self._get_function(
-            JNIFunctionIndices.NewObjectArray, JNIPrototypes.NewObjectArray
-        )
-        return func(self.env, length, element_class, initial_element)
-
-    def GetObjectArrayElement(self, array: Any, index: int) -> Optional[Any]:
-        """Get object array element"""
-        func = self._get_function(
-            JNIFunctionIndices.GetObjectArrayElement,
-            JNIPrototypes.GetObjectArrayElement,
-        )
-        return func(self.env, array, index)
-
-    def SetObjectArrayElement(self, array: Any, index: int, value: Any) -> None:
-        """Set object array element"""
-        func = self._get_function(
-            JNIFunctionIndices.SetObjectArrayElement,
-            JNIPrototypes.SetObjectArrayElement,
-        )
-        func(self.env, array, index, value)
+        return self._fn_NewObjectArray(self.env, length, element_class, initial_element)
+
+    def set_object_array_range(self, array: Any, start: int, values: Any) -> None:
+        """Pythonシーケンスで配列範囲を一括設定（要素毎のメソッド呼び出しを排除）
+
+        ArrayStoreException等の保留中に次のJNI呼び出しを発行しないよう、
+        例外チェックは要素毎に行う。
+        """
+        fn = self._fn_SetObjectArrayElement
+        env = self.env
+        chk = self._chk
+        for i, value in enumerate(values, start):
+            fn(env, array, i, value)
+            if chk(env):
+                self._handle_exception()
+
+    def get_object_array_range(self, array: Any, start: int, stop: int) -> list[Any]:
+        """配列範囲をローカル参照のまま一括取得
+
+        返される参照の解放は呼び出し側が管理する。フレームで一括回収
+        したい場合はiter_object_array / collect_object_arrayを使う。
+        """
+        fn = self._fn_GetObjectArrayElement
+        env = self.env
+        chk = self._chk
+        elements: list[Any] = []
+        append = elements.append
+        for i in range(start, stop):
+            append(fn(env, array, i))
+            if chk(env):
+                self._handle_exception()
+        return elements
+
+    # LazyDeleteLocalRefのフラッシュ閾値
+    _DELETE_BATCH = 256
+
+    def LazyDeleteLocalRef(self, local_ref: Any) -> None:
+        """ローカル参照の解放をバッファし、閾値到達でまとめてフラッシュ"""
+        pending = self._pending_deletes
+        pending.append(local_ref)
+        if len(pending) >= self._DELETE_BATCH:
+            self.flush_local_ref_deletes()
+
+    def flush_local_ref_deletes(self) -> None:
+        """バッファ済みローカル参照を一括解放"""
+        pending = self._pending_deletes
+        if not pending:
+            return
+        self._pending_deletes = []
+        fn = self._fn_DeleteLocalRef
+        env = self.env
+        for ref in pending:
+            fn(env, ref)
+
+    @contextlib.contextmanager
+    def local_frame(self, cap: int = 16) -> Iterator[None]:
+        """ローカル参照フレームのコンテキストマネージャ
+
+        ブロック内で生成したローカル参照をPopLocalFrame1回で回収する。
+        参照生成毎のDeleteLocalRefより安全で安価な既定イディオム。
+        """
+        if self.PushLocalFrame(cap) != 0:
+            raise RuntimeError("Failed to push local frame")
+        try:
+            yield
+        finally:
+            self.PopLocalFrame(None)
+
+    def iter_object_array(
+        self, array: Any, start: int, stop: int, cap: int = 64
+    ) -> Iterator[Any]:
+        """オブジェクト配列をローカルフレーム内で走査するジェネレータ
+
+        要素毎のDeleteLocalRefを1回のPopLocalFrameに集約する。
+        yieldされる参照はフレーム終了で無効になるため、走査中に
+        消費するか、必要な要素だけNewGlobalRefで昇格させること。
+        """
+        if self.PushLocalFrame(cap) != 0:
+            raise RuntimeError("Failed to push local frame")
+        fn = self._fn_GetObjectArrayElement
+        env = self.env
+        try:
+            for i in range(start, stop):
+                yield fn(env, array, i)
+        finally:
+            self.PopLocalFrame(None)
 
-    # Exception Operations
-    def Throw(self, throwable: Any) -> int:
-        """Throw exception"""
-        func = self._get_function(JNIFunctionIndices.Throw, JNIPrototypes.Throw)
-        return cast(int, func(self.env, throwable))
+    def collect_object_array(self, array: Any, n: int) -> list[Any]:
+        """オブジェクト配列の全要素をグローバル参照で回収"""
+        if self.PushLocalFrame(max(n, 4)) != 0:
+            raise RuntimeError("Failed to push local frame")
+        fn = self._fn_GetObjectArrayElement
+        new_global = self._fn_NewGlobalRef
+        env = self.env
+        results: list[Any] = []
+        try:
+            for i in range(n):
+                element = fn(env, array, i)
+                results.append(new_global(env, element) if element else None)
+        finally:
+            self.PopLocalFrame(None)
+        if self._chk(env):
+            self._handle_exception()
+        return results
+
+    def _message_ptr(self, message: str) -> Any:
+        """短いメッセージは事前確保のスクラッチへコピーして渡す"""
+        encoded = _utf8(message)
+        length = len(encoded)
+        scratch = self._msg_scratch
+        if length < len(scratch) - 1:
+            ctypes.memmove(scratch, encoded, length)
+            scratch[length] = b"\0"
+            return scratch
+        return encoded
 
     def ThrowNew(self, clazz: Any, message: str) -> int:
         """Throw new exception"""
-        func = self._get_function(JNIFunctionIndices.ThrowNew, JNIPrototypes.ThrowNew)
-        return cast(int, func(self.env, clazz, message.encode("utf-8")))
-
-    def ExceptionOccurred(self) -> Optional[Any]:
-        """Check if exception occurred"""
-        func = self._get_function(
-            JNIFunctionIndices.ExceptionOccurred, JNIPrototypes.ExceptionOccurred
-        )
-        return func(self.env)
-
-    def ExceptionDescribe(self) -> None:
-        """Describe exception"""
-        func = self._get_function(
-            JNIFunctionIndices.ExceptionDescribe, JNIPrototypes.ExceptionDescribe
-        )
-        func(self.env)
-
-    def ExceptionClear(self) -> None:
-        """Clear exception"""
-        func = self._get_function(
-            JNIFunctionIndices.ExceptionClear, JNIPrototypes.ExceptionClear
-        )
-        func(self.env)
+        return self._fn_ThrowNew(self.env, clazz, self._message_ptr(message))
 
     def FatalError(self, message: str) -> None:
         """Report fatal error"""
-        func = self._get_function(
-            JNIFunctionIndices.FatalError, JNIPrototypes.FatalError
-        )
-        func(self.env, message.encode("utf-8"))
-
-    def ExceptionCheck(self) -> bool:
-        """Check if exception is pending"""
-        func = self._get_function(
-            JNIFunctionIndices.ExceptionCheck, JNIPrototypes.ExceptionCheck
-        )
-        return bool(func(self.env))
+        self._fn_FatalError(self.env, self._message_ptr(message))
 
     # Reference Management
-    def NewGlobalRef(self, obj: Any) -> Optional[Any]:
-        """グローバル参照を作成"""
-        func = self._get_function(
-            JNIFunctionIndices.NewGlobalRef, JNIPrototypes.NewGlobalRef
-        )
-        return func(self.env, obj)
-
-    def DeleteGlobalRef(self, global_ref: Any) -> None:
-        """Delete global reference"""
-        func = self._get_function(
-            JNIFunctionIndices.DeleteGlobalRef, JNIPrototypes.DeleteGlobalRef
-        )
-        func(self.env, global_ref)
-
-    def DeleteLocalRef(self, local_ref: Any) -> None:
-        """Delete local reference"""
-        func = self._get_function(
-            JNIFunctionIndices.DeleteLocalRef, JNIPrototypes.DeleteLocalRef
-        )
-        func(self.env, local_ref)
-
-    def NewLocalRef(self, ref: Any) -> Optional[Any]:
-        """Create local reference"""
-        func = self._get_function(
-            JNIFunctionIndices.NewLocalRef, JNIPrototypes.NewLocalRef
-        )
-        return func(self.env, ref)
-
-    def EnsureLocalCapacity(self, capacity: int) -> int:
-        """Ensure local reference capacity"""
-        func = self._get_function(
-            JNIFunctionIndices.EnsureLocalCapacity, JNIPrototypes.EnsureLocalCapacity
-        )
-        return cast(int, func(self.env, capacity))
-
-    def PushLocalFrame(self, capacity: int) -> int:
-        """Push local frame"""
-        func = self._get_function(
-            JNIFunctionIndices.PushLocalFrame, JNIPrototypes.PushLocalFrame
-        )
-        return cast(int, func(self.env, capacity))
-
-    def PopLocalFrame(self, result: Any) -> Optional[Any]:
-        """Pop local frame"""
-        func = self._get_function(
-            JNIFunctionIndices.PopLocalFrame, JNIPrototypes.PopLocalFrame
-        )
-        return func(self.env, result)
+    def DeleteGlobalRefs(self, refs: list[Any]) -> None:
+        """複数のグローバル参照をポインタ・env取得1回でまとめて解放"""
+        fn = self._fn_DeleteGlobalRef
+        env = self.env
+        for ref in refs:
+            if ref:
+                fn(env, ref)
+
+    def NewGlobalRefCached(self, obj: Any) -> Optional[Any]:
+        """同一ハンドルへのグローバル参照を参照数で共有（opt-in）
+
+        クラスオブジェクト等、同じ参照を繰り返し昇格させる用途向け。
+        対で必ずDeleteGlobalRefCachedを使うこと。
+        """
+        key = obj if isinstance(obj, int) else obj.value
+        entry = self._global_ref_cache.get(key)
+        if entry is not None:
+            entry[1] += 1
+            return entry[0]
+        ref = self._fn_NewGlobalRef(self.env, obj)
+        if ref is None:
+            return None
+        ref_key = ref if isinstance(ref, int) else ref.value
+        self._global_ref_cache[key] = [ref, 1]
+        self._global_ref_index[ref_key] = key
+        return ref
+
+    def DeleteGlobalRefCached(self, global_ref: Any) -> None:
+        """参照数が尽きたときだけ実際にJNIへ解放を依頼する"""
+        ref_key = global_ref if isinstance(global_ref, int) else global_ref.value
+        key = self._global_ref_index.get(ref_key)
+        if key is None:
+            self._fn_DeleteGlobalRef(self.env, global_ref)
+            return
+        entry = self._global_ref_cache[key]
+        entry[1] -= 1
+        if entry[1] <= 0:
+            del self._global_ref_cache[key]
+            del self._global_ref_index[ref_key]
+            self._fn_DeleteGlobalRef(self.env, global_ref)
 
     # Weak Global References
-    def NewWeakGlobalRef(self, obj: Any) -> Optional[Any]:
-        """Create weak global reference"""
-        func = self._get_function(
-            JNIFunctionIndices.NewWeakGlobalRef, JNIPrototypes.NewWeakGlobalRef
-        )
-        return func(self.env, obj)
-
-    def DeleteWeakGlobalRef(self, weak_ref: Any) -> None:
-        """Delete weak global reference"""
-        func = self._get_function(
-            JNIFunctionIndices.DeleteWeakGlobalRef, JNIPrototypes.DeleteWeakGlobalRef
-        )
-        func(self.env, weak_ref)
-
-    # Monitor Operations
-    def MonitorEnter(self, obj: Any) -> int:
-        """Enter monitor"""
-        func = self._get_function(
-            JNIFunctionIndices.MonitorEnter, JNIPrototypes.MonitorEnter
-        )
-        return cast(int, func(self.env, obj))
-
-    def MonitorExit(self, obj: Any) -> int:
-        """Exit monitor"""
-        func = self._get_function(
-            JNIFunctionIndices.MonitorExit, JNIPrototypes.MonitorExit
-        )
-        return cast(int, func(self.env, obj))
-
-    # Java VM Interface
-    def GetJavaVM(self, vm_ptr: Any) -> int:
-        """Get Java VM interface"""
-        func = self._get_function(JNIFunctionIndices.GetJavaVM, JNIPrototypes.GetJavaVM)
-        return cast(int, func(self.env, vm_ptr))
+    @staticmethod
+    def is_null(ref: Any) -> bool:
+        """参照ハンドルのNULL判定（c_void_p戻り値はNULL時None）"""
+        return not ref
+
+    def check_and_clear(self, describe: bool = False) -> bool:
+        """例外チェックとクリアを1エントリに融合
+
+        例外なし（圧倒的多数派）ならFFI1ホップで即False。
+        """
+        if not self._chk(self.env):
+            return False
+        if describe:
+            self._fn_ExceptionDescribe(self.env)
+        self._fn_ExceptionClear(self.env)
+        return True
 
     # Reflection Support
     def FromReflectedMethod(self, method: Any) -> Optional[Any]:
         """Convert reflected method to method ID"""
-        func = self._get_function(
-            JNIFunctionIndices.FromReflectedMethod, JNIPrototypes.FromReflectedMethod
-        )
-        return func(self.env, method)
+        return self._fn_FromReflectedMethod(self.env, method)
 
     def FromReflectedField(self, field: Any) -> Optional[Any]:
         """Convert reflected field to field ID"""
-        func = self._get_function(
-            JNIFunctionIndices.FromReflectedField, JNIPrototypes.FromReflectedField
-        )
-        return func(self.env, field)
+        return self._fn_FromReflectedField(self.env, field)
 
     def ToReflectedMethod(
         self, clazz: Any, method_id: Any, is_static: bool
     ) -> Optional[Any]:
-        """Convert method ID to reflected method"""
-        func = self._get_function(
-            JNIFunctionIndices.ToReflectedMethod, JNIPrototypes.ToReflectedMethod
-        )
-        return func(self.env, clazz, method_id, is_static)
+        """Convert method ID to reflected method
+
+        結果はグローバル参照に昇格してキャッシュする。clazzには
+        グローバル参照を渡すこと。
+        """
+        key = (_handle_key(clazz), _handle_key(method_id), is_static)
+        cached = self._reflected_cache.get(key)
+        if cached is not None:
+            return cached
+        result = self._fn_ToReflectedMethod(self.env, clazz, method_id, is_static)
+        if result is None:
+            return None
+        global_ref = self._fn_NewGlobalRef(self.env, result)
+        if global_ref is None:
+            return result
+        self._fn_DeleteLocalRef(self.env, result)
+        self._reflected_cache[key] = global_ref
+        return global_ref
 
     def ToReflectedField(
         self, clazz: Any, field_id: Any, is_static: bool
     ) -> Optional[Any]:
-        """Convert field ID to reflected field"""
-        func = self._get_function(
-            JNIFunctionIndices.ToReflectedField, JNIPrototypes.ToReflectedField
-        )
-        return func(self.env, clazz, field_id, is_static)
+        """Convert field ID to reflected field（ToReflectedMethodと同様にキャッシュ）"""
+        key = (_handle_key(clazz), _handle_key(field_id), is_static)
+        cached = self._reflected_cache.get(key)
+        if cached is not None:
+            return cached
+        result = self._fn_ToReflectedField(self.env, clazz, field_id, is_static)
+        if result is None:
+            return None
+        global_ref = self._fn_NewGlobalRef(self.env, result)
+        if global_ref is None:
+            return result
+        self._fn_DeleteLocalRef(self.env, result)
+        self._reflected_cache[key] = global_ref
+        return global_ref
+
+    def clear_reflected_cache(self) -> None:
+        """キャッシュ済みリフレクションオブジェクトの参照を解放"""
+        cache = self._reflected_cache
+        self._reflected_cache = {}
+        for global_ref in cache.values():
+            try:
+                self._fn_DeleteGlobalRef(self.env, global_ref)
+            except Exception:
+                pass
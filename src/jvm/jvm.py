@@ -1,7 +1,8 @@
 from __future__ import annotations
 
+from collections import OrderedDict
 from dataclasses import dataclass
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional
 
 from .jni import JNIHelper
 from .logger import logger
@@ -9,6 +10,9 @@ from .logger import logger
 # 定数
 STATIC_MODIFIER = 8
 MAX_PARAM_COUNT = 50
+UTF_INTERN_MAX = 4096
+CLASS_MISS_CACHE_MAX = 4096
+MAX_CLASS_CACHE = 4096
 
 
 class JNIException(Exception):
@@ -17,7 +21,177 @@ class JNIException(Exception):
     pass
 
 
-@dataclass
+# パッケージ別の一般的なクラス名パターン (モジュールロード時に一度だけ構築)
+_COMMON_CLASS_PATTERNS: Dict[str, tuple[str, ...]] = {
+    "java.lang": (
+        "Object",
+        "String",
+        "System",
+        "Class",
+        "Thread",
+        "Runtime",
+        "Integer",
+        "Long",
+        "Double",
+        "Float",
+        "Boolean",
+        "Byte",
+        "Short",
+        "Character",
+        "Number",
+        "Math",
+        "StrictMath",
+        "StringBuffer",
+        "StringBuilder",
+        "Throwable",
+        "Exception",
+        "RuntimeException",
+        "Error",
+        "ClassLoader",
+        "Package",
+        "Process",
+        "ProcessBuilder",
+        "SecurityManager",
+        "Void",
+        "Enum",
+        "Deprecated",
+        "Override",
+        "SuppressWarnings",
+        "SafeVarargs",
+        "FunctionalInterface",
+        "Cloneable",
+        "Comparable",
+        "Iterable",
+        "Readable",
+        "Runnable",
+    ),
+    "java.util": (
+        "List",
+        "ArrayList",
+        "LinkedList",
+        "Vector",
+        "Stack",
+        "Set",
+        "HashSet",
+        "LinkedHashSet",
+        "TreeSet",
+        "Map",
+        "HashMap",
+        "LinkedHashMap",
+        "TreeMap",
+        "Hashtable",
+        "Collection",
+        "Collections",
+        "Arrays",
+        "Objects",
+        "Iterator",
+        "ListIterator",
+        "Enumeration",
+        "Queue",
+        "Deque",
+        "ArrayDeque",
+        "PriorityQueue",
+        "Date",
+        "Calendar",
+        "GregorianCalendar",
+        "TimeZone",
+        "Random",
+        "Scanner",
+        "Timer",
+        "TimerTask",
+        "Properties",
+        "ResourceBundle",
+        "Locale",
+        "UUID",
+        "Currency",
+        "Formatter",
+        "StringTokenizer",
+        "Observer",
+        "Observable",
+        "EventListener",
+        "EventObject",
+    ),
+    "java.io": (
+        "File",
+        "InputStream",
+        "OutputStream",
+        "Reader",
+        "Writer",
+        "FileInputStream",
+        "FileOutputStream",
+        "FileReader",
+        "FileWriter",
+        "BufferedInputStream",
+        "BufferedOutputStream",
+        "BufferedReader",
+        "BufferedWriter",
+        "ByteArrayInputStream",
+        "ByteArrayOutputStream",
+        "StringReader",
+        "StringWriter",
+        "PrintWriter",
+        "PrintStream",
+        "DataInputStream",
+        "DataOutputStream",
+        "ObjectInputStream",
+        "ObjectOutputStream",
+        "RandomAccessFile",
+        "FileDescriptor",
+        "FilePermission",
+        "IOException",
+        "FileNotFoundException",
+        "EOFException",
+        "Serializable",
+        "Externalizable",
+        "ObjectInput",
+        "ObjectOutput",
+        "Closeable",
+        "Flushable",
+        "FilterInputStream",
+        "FilterOutputStream",
+    ),
+}
+
+# その他のパッケージに試す一般的なパターン
+_GENERIC_CLASS_PATTERNS = (
+    "Object",
+    "Exception",
+    "Utils",
+    "Helper",
+    "Manager",
+    "Factory",
+    "Builder",
+    "Handler",
+    "Listener",
+    "Event",
+    "Constants",
+)
+
+# 既知パッケージはFQCNまで事前結合し、探索毎の文字列連結を省く
+_KNOWN_FQCNS: Dict[str, tuple[str, ...]] = {
+    pkg: tuple(f"{pkg}.{name}" for name in patterns)
+    for pkg, patterns in _COMMON_CLASS_PATTERNS.items()
+}
+
+
+def _filter_jar_entries(entry_names: List[str], package_path: str) -> List[str]:
+    """パッケージ直下の.classエントリ名をFQCNへ一括変換
+
+    JNI走査と切り離した内包表記の単一パスで、要素毎の
+    インタプリタオーバーヘッドを抑える。
+    """
+    prefix = package_path + "/"
+    prefix_len = len(prefix)
+    return [
+        name[:-6].replace("/", ".")
+        for name in entry_names
+        if name.endswith(".class")
+        and name.startswith(prefix)  # noqa: W503
+        and name.find("/", prefix_len) == -1  # noqa: W503
+    ]
+
+
+@dataclass(slots=True, frozen=True)
 class JavaMethod:
     """Javaメソッド情報"""
 
@@ -32,7 +206,7 @@ class JavaMethod:
         return f"JavaMethod(name='{self.name}', params=[{params_str}], returns='{self.return_type}'{static_str})"
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class JavaField:
     """Javaフィールド情報"""
 
@@ -45,7 +219,7 @@ class JavaField:
         return f"JavaField(name='{self.name}', type='{self.type}'{static_str})"
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class JavaClass:
     """Javaクラス情報"""
 
@@ -67,7 +241,25 @@ class JVM:
         self.env: Any = env_ptr
         self.jni: JNIHelper = JNIHelper(env_ptr)
         self._shutdown_complete: bool = False
-        self._class_cache: Dict[str, Any] = {}
+        # LRU順を保つクラスキャッシュ (上限超過時は最古参照を解放して追い出す)
+        self._class_cache: OrderedDict[str, Any] = OrderedDict()
+        # FindClass失敗の負キャッシュ (同じミスの再試行をFFIなしで短絡)
+        self._class_miss_cache: set[str] = set()
+        # リフレクションAPI用method IDキャッシュ (クラス名, メソッド名, シグネチャ)
+        self._reflection_ids: Dict[tuple[str, str, str], Any] = {}
+        # デコード済みUTF-8文字列のインターン表 (型名等の重複を1オブジェクトに集約)
+        self._utf_intern: Dict[str, str] = {}
+        # 頻出クラスを起動時に解決し属性参照で辞書引きを省く
+        self._class_Class: Any = None
+        self._class_Method: Any = None
+        self._class_Field: Any = None
+        self._class_String: Any = None
+        self._class_System: Any = None
+        self._class_File: Any = None
+        self._class_JarFile: Any = None
+        # Class.forNameのmethod ID (初回使用時に解決して再利用)
+        self._forname_mid: Any = None
+        self._prime_well_known_classes()
 
     def graceful_shutdown(self) -> None:
         """安全なJVMシャットダウン"""
@@ -77,24 +269,22 @@ class JVM:
         try:
             logger.debug("Initiating graceful JVM shutdown...")
 
-            # クラス参照をクリーンアップ
+            # クラス参照を一括クリーンアップ
             logger.debug(
-                f"Cleaning up {len(self._class_cache)} cached class references"
+                "Cleaning up %s cached class references", len(self._class_cache)
             )
-            for class_name, global_ref in self._class_cache.items():
-                try:
-                    if global_ref:
-                        self.jni.DeleteGlobalRef(global_ref)
-                        logger.debug(
-                            f"Cleaned up global reference for class: {class_name}"
-                        )
-                except Exception as e:
-                    logger.warning(
-                        f"Failed to cleanup global reference for {class_name}: {e}"
-                    )
+            try:
+                self.jni.DeleteGlobalRefs(list(self._class_cache.values()))
+            except Exception as e:
+                logger.warning("Failed to cleanup class global references: %s", e)
 
             self._class_cache.clear()
 
+            # キャッシュ済みjstring・リフレクション参照と保留中の解放を処理
+            self.jni.clear_string_cache()
+            self.jni.clear_reflected_cache()
+            self.jni.flush_local_ref_deletes()
+
             if self.jni.PushLocalFrame(64) == 0:
                 try:
                     runtime_class = self.jni.FindClass("java/lang/Runtime")
@@ -124,14 +314,38 @@ class JVM:
             logger.debug("JVM graceful shutdown completed")
 
         except Exception as e:
-            logger.warning(f"Error during graceful shutdown: {e}")
+            logger.warning("Error during graceful shutdown: %s", e)
             self._shutdown_complete = True
 
+    # 起動時に解決しておく頻出クラス (属性名, JNI名)
+    _WELL_KNOWN_CLASSES = (
+        ("_class_Class", "java/lang/Class"),
+        ("_class_Method", "java/lang/reflect/Method"),
+        ("_class_Field", "java/lang/reflect/Field"),
+        ("_class_String", "java/lang/String"),
+        ("_class_System", "java/lang/System"),
+        ("_class_File", "java/io/File"),
+        ("_class_JarFile", "java/util/jar/JarFile"),
+    )
+
+    def _prime_well_known_classes(self) -> None:
+        """頻出クラスのグローバル参照を構築時にまとめて解決"""
+        for attr, class_name in self._WELL_KNOWN_CLASSES:
+            try:
+                setattr(self, attr, self._find_class(class_name))
+            except JNIException:
+                logger.debug("Could not pre-resolve well-known class: %s", class_name)
+
     def _find_class(self, class_name: str) -> Any:
         """クラス検索（キャッシュ付き）"""
-        if class_name in self._class_cache:
-            logger.debug(f"Found cached class: {class_name}")
-            return self._class_cache[class_name]
+        cached = self._class_cache.get(class_name)
+        if cached is not None:
+            logger.debug("Found cached class: %s", class_name)
+            self._class_cache.move_to_end(class_name)
+            return cached
+
+        if class_name in self._class_miss_cache:
+            raise JNIException(f"Could not find class: {class_name}")
 
         try:
             jclass = self.jni.FindClass(class_name)
@@ -140,8 +354,10 @@ class JVM:
 
             global_ref = self.jni.NewGlobalRef(jclass)
             if global_ref:
+                if len(self._class_cache) >= MAX_CLASS_CACHE:
+                    self._evict_oldest_class_ref()
                 self._class_cache[class_name] = global_ref
-                logger.debug(f"Cached class as global reference: {class_name}")
+                logger.debug("Cached class as global reference: %s", class_name)
                 return global_ref
             else:
                 logger.warning(
@@ -150,8 +366,29 @@ class JVM:
                 return jclass
 
         except Exception as e:
+            # 同じ名前での再試行をPython層で止める (キャッシュ満杯時は全クリア)
+            if len(self._class_miss_cache) >= CLASS_MISS_CACHE_MAX:
+                self._class_miss_cache.clear()
+            self._class_miss_cache.add(class_name)
             raise JNIException(f"Failed to find class {class_name}: {e}")
 
+    def _evict_oldest_class_ref(self) -> None:
+        """最古のキャッシュエントリを追い出しグローバル参照を解放
+
+        構築時に属性へ束縛した頻出クラスの参照は生かしたまま外す。
+        """
+        evicted_name, evicted_ref = self._class_cache.popitem(last=False)
+        for attr, _ in self._WELL_KNOWN_CLASSES:
+            if getattr(self, attr) is evicted_ref:
+                return
+        try:
+            self.jni.DeleteGlobalRef(evicted_ref)
+            logger.debug("Evicted cached class reference: %s", evicted_name)
+        except Exception as e:
+            logger.warning(
+                f"Failed to release evicted class reference {evicted_name}: {e}"
+            )
+
     def _get_method_id(self, jclass: Any, method_name: str, signature: str) -> Any:
         """メソッドID取得"""
         try:
@@ -217,13 +454,25 @@ class JVM:
             raise JNIException(f"Failed to get string UTF length: {e}")
 
     def _get_string_utf_chars(self, jstring: Any) -> str:
-        """JNI GetStringUTFChars function wrapper"""
+        """JNI GetStringUTFChars function wrapper
+
+        クラスダンプでは同じ型名 ("void", "int", "java.lang.String", …)
+        が大量に返るため、デコード結果をインターン表で共有して
+        重複オブジェクトの保持を避ける。
+        """
         if not jstring:
             return ""
 
         try:
             result = self.jni.GetStringUTFChars(jstring)
-            return result if result is not None else ""
+            if result is None:
+                return ""
+            interned = self._utf_intern.get(result)
+            if interned is not None:
+                return interned
+            if len(self._utf_intern) < UTF_INTERN_MAX:
+                self._utf_intern[result] = result
+            return result
         except Exception:
             return "get_error"
 
@@ -258,234 +507,199 @@ class JVM:
 
         return self.jni.CallObjectMethod(obj, method_id)
 
-    def _extract_method_name(self, method_obj: Any) -> str:
-        """Methodオブジェクトからメソッド名を取得"""
+    def _get_reflection_method_id(
+        self, class_name: str, method_name: str, signature: str
+    ) -> Any:
+        """リフレクションAPIのmethod IDを遅延解決してキャッシュ"""
+        key = (class_name, method_name, signature)
+        method_id = self._reflection_ids.get(key)
+        if method_id is None:
+            if class_name == "java/lang/Class":
+                jclass = self._class_Class
+            elif class_name == "java/lang/reflect/Method":
+                jclass = self._class_Method
+            elif class_name == "java/lang/reflect/Field":
+                jclass = self._class_Field
+            else:
+                jclass = None
+            if jclass is None:
+                jclass = self._find_class(class_name)
+            method_id = self.jni.GetMethodID(jclass, method_name, signature)
+            if not method_id:
+                raise JNIException(f"Could not find method: {method_name}")
+            self._reflection_ids[key] = method_id
+        return method_id
+
+    def _call_reflection_method(
+        self, obj: Any, class_name: str, method_name: str, signature: str
+    ) -> Any:
+        """既知クラスのメソッドをキャッシュ済みIDで呼び出す
+
+        宣言クラスのmethod IDはサブクラスのインスタンスにも有効なので、
+        GetObjectClass + GetMethodID の往復を毎回払わずに済む。
+        """
+        method_id = self._get_reflection_method_id(class_name, method_name, signature)
+        return self.jni.CallObjectMethod(obj, method_id)
+
+    def _reflected_member_name(self, obj: Any, class_name: str, default: str) -> str:
+        """Method/FieldオブジェクトのgetName結果をデコード"""
         try:
-            name_string = self._call_object_method_with_signature_direct(
-                method_obj, "getName", "()Ljava/lang/String;"
-            )
-            return (
-                self._get_string_utf_chars(name_string)
-                if name_string
-                else "unknown_method"
+            name_string = self._call_reflection_method(
+                obj, class_name, "getName", "()Ljava/lang/String;"
             )
+            if name_string:
+                return self._get_string_utf_chars(name_string)
         except Exception:
-            return "unknown_method"
+            pass
+        return default
 
-    def _extract_method_return_type(self, method_obj: Any) -> str:
-        """Methodオブジェクトから戻り値型を取得"""
+    def _reflected_class_name(self, type_obj: Any) -> Optional[str]:
+        """ClassオブジェクトのgetName結果をデコード (空文字はNone)"""
         try:
-            return_type_obj = self._call_object_method_with_signature_direct(
-                method_obj, "getReturnType", "()Ljava/lang/Class;"
+            name_string = self._call_reflection_method(
+                type_obj, "java/lang/Class", "getName", "()Ljava/lang/String;"
             )
-            if return_type_obj:
-                return_type_string = self._call_object_method_with_signature_direct(
-                    return_type_obj, "getName", "()Ljava/lang/String;"
-                )
-                if return_type_string:
-                    return_type = self._get_string_utf_chars(return_type_string)
-                    # 安全性チェック: 空文字列の場合はデフォルト値
-                    if not return_type or return_type.strip() == "":
-                        return "void"
-                    return return_type
+            if name_string:
+                decoded = self._get_string_utf_chars(name_string)
+                # 安全性チェック: 空文字列の場合はデフォルト値に任せる
+                if decoded and decoded.strip():
+                    return decoded
         except Exception:
             pass
-        return "void"
+        return None
+
+    def _reflected_is_static(self, obj: Any, class_name: str) -> bool:
+        """静的メンバー判定 (Modifier.STATICのビット演算)"""
+        try:
+            modifiers = self.jni.CallIntMethod(
+                obj,
+                self._get_reflection_method_id(class_name, "getModifiers", "()I"),
+            )
+            return bool(modifiers & STATIC_MODIFIER)
+        except Exception:
+            return False
 
     def _extract_method_parameters(self, method_obj: Any) -> List[str]:
-        """Methodオブジェクトからパラメータ型リストを取得"""
+        """メソッドのパラメータ型名リストを取得"""
+        parameters: List[str] = []
         try:
-            param_types_array = self._call_object_method_with_signature_direct(
-                method_obj, "getParameterTypes", "()[Ljava/lang/Class;"
+            param_types_array = self._call_reflection_method(
+                method_obj,
+                "java/lang/reflect/Method",
+                "getParameterTypes",
+                "()[Ljava/lang/Class;",
             )
             if not param_types_array:
-                return []
+                return parameters
 
             param_count = self._get_array_length(param_types_array)
             # 配列が大きすぎる場合は処理を制限 (安全性優先)
             if param_count > MAX_PARAM_COUNT:
                 return ["..."]
 
-            parameters = []
-            for i in range(param_count):
+            # 要素参照を一括転送してから名前解決 (要素毎の往復を排除)
+            param_classes = self.jni.get_object_array_range(
+                param_types_array, 0, param_count
+            )
+            for param_class in param_classes:
                 try:
-                    param_class = self._get_object_array_element(param_types_array, i)
-                    if param_class:
-                        param_name_string = (
-                            self._call_object_method_with_signature_direct(
-                                param_class, "getName", "()Ljava/lang/String;"
-                            )
-                        )
-                        if param_name_string:
-                            param_name = self._get_string_utf_chars(param_name_string)
-                            # 安全性チェック: 空文字列の場合はデフォルト値
-                            if param_name and param_name.strip():
-                                parameters.append(param_name)
-                            else:
-                                parameters.append("Object")
-                        else:
-                            parameters.append("Object")
-                    else:
-                        parameters.append("Object")
+                    param_name = (
+                        self._reflected_class_name(param_class) if param_class else None
+                    )
+                    parameters.append(param_name or "Object")
                 except Exception:
                     # 個別のパラメータ取得に失敗した場合は Object
                     parameters.append("Object")
-            return parameters
         except Exception:
             return []
-
-    def _extract_method_is_static(self, method_obj: Any) -> bool:
-        """Methodオブジェクトから静的メソッドかを判定"""
-        try:
-            modifiers = self._call_object_method_with_signature_direct(
-                method_obj, "getModifiers", "()I"
-            )
-            if modifiers is not None:
-                # Modifier.STATICのビット演算で確認
-                return bool(modifiers & STATIC_MODIFIER)
-        except Exception:
-            pass
-        return False
+        return parameters
 
     def _extract_method_info(self, method_obj: Any) -> JavaMethod:
-        """`java.lang.reflect.Method` オブジェクトから情報を抽出"""
-        try:
-            name = self._extract_method_name(method_obj)
+        """`java.lang.reflect.Method` オブジェクトから情報を抽出
 
-            return_type = self._extract_method_return_type(method_obj)
-
-            parameters = self._extract_method_parameters(method_obj)
-
-            is_static = self._extract_method_is_static(method_obj)
-
-            return JavaMethod(
-                name=name,
-                parameters=parameters,
-                return_type=return_type,
-                is_static=is_static,
-            )
-        except JNIException:
-            return JavaMethod(
-                name="unknown_method",
-                parameters=[],
-                return_type="void",
-                is_static=False,
-            )
-        except Exception:
-            return JavaMethod(
-                name="unknown_method",
-                parameters=[],
-                return_type="void",
-                is_static=False,
-            )
+        各属性はキャッシュ済みmethod ID経由の小さなヘルパーで解決する。
+        """
+        name = self._reflected_member_name(
+            method_obj, "java/lang/reflect/Method", "unknown_method"
+        )
 
-    def _extract_field_name(self, field_obj: Any) -> str:
-        """Fieldオブジェクトからフィールド名を取得"""
+        # 戻り値型
+        return_type = "void"
         try:
-            name_string = self._call_object_method_with_signature_direct(
-                field_obj, "getName", "()Ljava/lang/String;"
+            return_type_obj = self._call_reflection_method(
+                method_obj,
+                "java/lang/reflect/Method",
+                "getReturnType",
+                "()Ljava/lang/Class;",
             )
-            return (
-                self._get_string_utf_chars(name_string)
-                if name_string
-                else "unknown_field"
-            )
-        except Exception:
-            return "unknown_field"
-
-    def _extract_field_type(self, field_obj: Any) -> str:
-        """Fieldオブジェクトからフィールド型を取得"""
-        try:
-            type_obj = self._call_object_method_with_signature_direct(
-                field_obj, "getType", "()Ljava/lang/Class;"
-            )
-            if type_obj:
-                type_string = self._call_object_method_with_signature_direct(
-                    type_obj, "getName", "()Ljava/lang/String;"
-                )
-                if type_string:
-                    field_type = self._get_string_utf_chars(type_string)
-                    # 安全性チェック: 空文字列の場合はデフォルト値
-                    if not field_type or field_type.strip() == "":
-                        return "Object"
-                    return field_type
+            if return_type_obj:
+                return_type = self._reflected_class_name(return_type_obj) or "void"
         except Exception:
             pass
-        return "Object"
 
-    def _extract_field_is_static(self, field_obj: Any) -> bool:
-        """Fieldオブジェクトから静的フィールドかを判定"""
+        parameters = self._extract_method_parameters(method_obj)
+        is_static = self._reflected_is_static(method_obj, "java/lang/reflect/Method")
+        return JavaMethod(name, parameters, return_type, is_static)
+
+    def _extract_field_info(self, field_obj: Any) -> JavaField:
+        """`java.lang.reflect.Field` オブジェクトから情報を抽出"""
+        name = self._reflected_member_name(
+            field_obj, "java/lang/reflect/Field", "unknown_field"
+        )
+
+        # フィールド型
+        field_type = "Object"
         try:
-            modifiers = self._call_object_method_with_signature_direct(
-                field_obj, "getModifiers", "()I"
+            type_obj = self._call_reflection_method(
+                field_obj, "java/lang/reflect/Field", "getType", "()Ljava/lang/Class;"
             )
-            if modifiers is not None:
-                # Modifier.STATICのビット演算で確認
-                return bool(modifiers & STATIC_MODIFIER)
+            if type_obj:
+                field_type = self._reflected_class_name(type_obj) or "Object"
         except Exception:
             pass
-        return False
 
-    def _extract_field_info(self, field_obj: Any) -> JavaField:
-        """`java.lang.reflect.Field` オブジェクトから情報を抽出"""
-        try:
-            name = self._extract_field_name(field_obj)
+        is_static = self._reflected_is_static(field_obj, "java/lang/reflect/Field")
+        return JavaField(name, field_type, is_static)
 
-            field_type = self._extract_field_type(field_obj)
-            is_static = self._extract_field_is_static(field_obj)
+    def _iter_reflected_array(
+        self, class_obj: Any, getter: str, signature: str
+    ) -> Iterator[Any]:
+        """リフレクション配列を1回の呼び出しで取得しフレーム内で走査
 
-            return JavaField(name=name, type=field_type, is_static=is_static)
-        except JNIException:
-            return JavaField(name="unknown_field", type="Object", is_static=False)
-        except Exception:
-            return JavaField(name="unknown_field", type="Object", is_static=False)
+        要素取得ループを単一のローカルフレームにまとめ、要素毎の
+        ラッパー呼び出しとDeleteLocalRefを排除する。
+        """
+        array = self._call_reflection_method(
+            class_obj, "java/lang/Class", getter, signature
+        )
+        if not array:
+            return
+        count = self._get_array_length(array)
+        # 抽出中に生成される付随参照も同じフレームで回収する
+        cap = min(count * 8 + 16, 512)
+        yield from self.jni.iter_object_array(array, 0, count, cap)
 
     def _extract_all_methods(self, class_obj: Any) -> List[JavaMethod]:
         """クラスのすべてのメソッド (declared + public継承) を取得"""
         all_methods: List[JavaMethod] = []
-        method_signatures: set[str] = set()  # 重複排除用
+        # 重複排除用 (名前, パラメータ型タプル) — 文字列整形なしでハッシュ可能
+        method_signatures: set[tuple[str, tuple[str, ...]]] = set()
 
         # 1. getDeclaredMethods() - そのクラスで宣言されたすべてのメソッド
-        try:
-            declared_methods_array = self._call_object_method_with_signature_direct(
-                class_obj, "getDeclaredMethods", "()[Ljava/lang/reflect/Method;"
-            )
-            if declared_methods_array:
-                method_count = self._get_array_length(declared_methods_array)
-                for i in range(method_count):
-                    method_obj = self._get_object_array_element(
-                        declared_methods_array, i
-                    )
-                    if method_obj:
-                        method_info = self._extract_method_info(method_obj)
-                        signature = (
-                            f"{method_info.name}({', '.join(method_info.parameters)})"
-                        )
-                        if signature not in method_signatures:
-                            all_methods.append(method_info)
-                            method_signatures.add(signature)
-        except Exception:
-            pass
-
         # 2. getMethods() - public メソッド (継承含む)
-        try:
-            public_methods_array = self._call_object_method_with_signature_direct(
-                class_obj, "getMethods", "()[Ljava/lang/reflect/Method;"
-            )
-            if public_methods_array:
-                method_count = self._get_array_length(public_methods_array)
-                for i in range(method_count):
-                    method_obj = self._get_object_array_element(public_methods_array, i)
+        for getter in ("getDeclaredMethods", "getMethods"):
+            try:
+                for method_obj in self._iter_reflected_array(
+                    class_obj, getter, "()[Ljava/lang/reflect/Method;"
+                ):
                     if method_obj:
                         method_info = self._extract_method_info(method_obj)
-                        signature = (
-                            f"{method_info.name}({', '.join(method_info.parameters)})"
-                        )
-                        if signature not in method_signatures:
+                        key = (method_info.name, tuple(method_info.parameters))
+                        if key not in method_signatures:
                             all_methods.append(method_info)
-                            method_signatures.add(signature)
-        except Exception:
-            pass
+                            method_signatures.add(key)
+            except Exception:
+                pass
 
         return all_methods
 
@@ -495,38 +709,19 @@ class JVM:
         field_names: set[str] = set()  # 重複排除用
 
         # 1. getDeclaredFields() - そのクラスで宣言されたすべてのフィールド
-        try:
-            declared_fields_array = self._call_object_method_with_signature_direct(
-                class_obj, "getDeclaredFields", "()[Ljava/lang/reflect/Field;"
-            )
-            if declared_fields_array:
-                field_count = self._get_array_length(declared_fields_array)
-                for i in range(field_count):
-                    field_obj = self._get_object_array_element(declared_fields_array, i)
-                    if field_obj:
-                        field_info = self._extract_field_info(field_obj)
-                        if field_info.name not in field_names:
-                            all_fields.append(field_info)
-                            field_names.add(field_info.name)
-        except Exception:
-            pass
-
         # 2. getFields() - public フィールド (継承含む)
-        try:
-            public_fields_array = self._call_object_method_with_signature_direct(
-                class_obj, "getFields", "()[Ljava/lang/reflect/Field;"
-            )
-            if public_fields_array:
-                field_count = self._get_array_length(public_fields_array)
-                for i in range(field_count):
-                    field_obj = self._get_object_array_element(public_fields_array, i)
+        for getter in ("getDeclaredFields", "getFields"):
+            try:
+                for field_obj in self._iter_reflected_array(
+                    class_obj, getter, "()[Ljava/lang/reflect/Field;"
+                ):
                     if field_obj:
                         field_info = self._extract_field_info(field_obj)
                         if field_info.name not in field_names:
                             all_fields.append(field_info)
                             field_names.add(field_info.name)
-        except Exception:
-            pass
+            except Exception:
+                pass
 
         return all_fields
 
@@ -566,16 +761,20 @@ class JVM:
 
             if discovered_classes:
                 logger.info(
-                    f"Discovered {len(discovered_classes)} classes in {package_name} via JNI Class.forName"
+                    "Discovered %s classes in %s via JNI Class.forName",
+                    len(discovered_classes),
+                    package_name,
                 )
             else:
                 logger.warning(
-                    f"No classes discovered for package {package_name} via JNI"
+                    "No classes discovered for package %s via JNI", package_name
                 )
 
         except Exception as e:
             logger.error(
-                f"JNI Class.forName discovery failed for package {package_name}: {e}"
+                "JNI Class.forName discovery failed for package %s: %s",
+                package_name,
+                e,
             )
 
         return discovered_classes
@@ -587,7 +786,7 @@ class JVM:
         try:
             # 1. パッケージが存在することを確認
             if not self._verify_package_exists(package_name):
-                logger.warning(f"Package {package_name} not found in loaded packages")
+                logger.warning("Package %s not found in loaded packages", package_name)
                 return discovered_classes
 
             # 2. Class.forName()で既知のクラスを探索
@@ -596,12 +795,16 @@ class JVM:
             )
 
             logger.info(
-                f"Discovered {len(discovered_classes)} classes in {package_name} via Class.forName"
+                "Discovered %s classes in %s via Class.forName",
+                len(discovered_classes),
+                package_name,
             )
 
         except Exception as e:
             logger.warning(
-                f"Failed to discover classes via Class.forName for {package_name}: {e}"
+                "Failed to discover classes via Class.forName for %s: %s",
+                package_name,
+                e,
             )
 
         return discovered_classes
@@ -612,7 +815,7 @@ class JVM:
 
         try:
             # System.getProperty("java.class.path")でクラスパス取得
-            system_class = self._find_class("java/lang/System")
+            system_class = self._class_System or self._find_class("java/lang/System")
             if not system_class:
                 raise Exception("Could not find System class")
 
@@ -639,7 +842,7 @@ class JVM:
             if not class_path_str:
                 return discovered_classes
 
-            logger.debug(f"Classpath: {class_path_str}")
+            logger.debug("Classpath: %s", class_path_str)
 
             # クラスパスを解析してクラスを発見
             discovered_classes = self._parse_classpath_for_package(
@@ -647,7 +850,7 @@ class JVM:
             )
 
         except Exception as e:
-            logger.warning(f"Failed to discover classes from classpath: {e}")
+            logger.warning("Failed to discover classes from classpath: %s", e)
 
         return discovered_classes
 
@@ -659,7 +862,7 @@ class JVM:
 
         try:
             # パスセパレータを取得
-            file_class = self._find_class("java/io/File")
+            file_class = self._class_File or self._find_class("java/io/File")
             if not file_class:
                 return discovered_classes
 
@@ -686,7 +889,7 @@ class JVM:
                 if not class_path_entry:
                     continue
 
-                logger.debug(f"Processing classpath entry: {class_path_entry}")
+                logger.debug("Processing classpath entry: %s", class_path_entry)
 
                 # JARファイルかディレクトリかを判定して処理
                 if class_path_entry.endswith(".jar"):
@@ -701,7 +904,7 @@ class JVM:
                     discovered_classes.extend(classes)
 
         except Exception as e:
-            logger.warning(f"Failed to parse classpath: {e}")
+            logger.warning("Failed to parse classpath: %s", e)
 
         return discovered_classes
 
@@ -713,7 +916,9 @@ class JVM:
 
         try:
             # java.util.jar.JarFileクラスを使用
-            jar_file_class = self._find_class("java/util/jar/JarFile")
+            jar_file_class = self._class_JarFile or self._find_class(
+                "java/util/jar/JarFile"
+            )
             if not jar_file_class:
                 return discovered_classes
 
@@ -762,7 +967,7 @@ class JVM:
                 pass  # クローズエラーは無視
 
         except Exception as e:
-            logger.debug(f"Failed to process JAR file {jar_path}: {e}")
+            logger.debug("Failed to process JAR file %s: %s", jar_path, e)
 
         return discovered_classes
 
@@ -778,7 +983,7 @@ class JVM:
             full_package_dir = f"{dir_path}/{package_path}"
 
             # java.io.Fileクラスを使用
-            file_class = self._find_class("java/io/File")
+            file_class = self._class_File or self._find_class("java/io/File")
             if not file_class:
                 return discovered_classes
 
@@ -827,7 +1032,7 @@ class JVM:
             )
 
         except Exception as e:
-            logger.debug(f"Failed to process directory {dir_path}: {e}")
+            logger.debug("Failed to process directory %s: %s", dir_path, e)
 
         return discovered_classes
 
@@ -853,43 +1058,50 @@ class JVM:
 
             package_path = package_name.replace(".", "/")
 
-            # エントリを反復処理
-            while True:
-                has_more = self.jni.CallBooleanMethod(entries_enum, has_more_method)
-                if not has_more:
-                    break
-
-                # JarEntry取得
-                jar_entry = self.jni.CallObjectMethod(entries_enum, next_element_method)
-                if not jar_entry:
-                    continue
-
-                # エントリ名取得
-                entry_name_string = self._call_object_method_with_signature_direct(
-                    jar_entry, "getName", "()Ljava/lang/String;"
-                )
-                if not entry_name_string:
-                    continue
+            # エントリ名の収集とフィルタを分離し、JNIループは転送に専念させる
+            # (生成されるローカル参照はフレームで一括回収、getNameのmethod IDは
+            #  最初のエントリで1回だけ解決して使い回す)
+            entry_names: List[str] = []
+            getname_mid = None
+            with self.jni.local_frame(512):
+                while True:
+                    has_more = self.jni.CallBooleanMethod(entries_enum, has_more_method)
+                    if not has_more:
+                        break
+
+                    # JarEntry取得
+                    jar_entry = self.jni.CallObjectMethod(
+                        entries_enum, next_element_method
+                    )
+                    if not jar_entry:
+                        continue
+
+                    if getname_mid is None:
+                        entry_class = self.jni.GetObjectClass(jar_entry)
+                        if not entry_class:
+                            continue
+                        getname_mid = self.jni.GetMethodID(
+                            entry_class, "getName", "()Ljava/lang/String;"
+                        )
+                        if not getname_mid:
+                            break
 
-                entry_name = self._get_string_utf_chars(entry_name_string)
-                if not entry_name:
-                    continue
+                    # エントリ名取得
+                    entry_name_string = self.jni.CallObjectMethod(
+                        jar_entry, getname_mid
+                    )
+                    if not entry_name_string:
+                        continue
 
-                # .classファイルでパッケージにマッチするものを抽出
-                if (
-                    entry_name.endswith(".class")
-                    and entry_name.startswith(package_path + "/")  # noqa: W503
-                    and "/"  # noqa: W503
-                    not in entry_name[len(package_path) + 1 :]  # noqa: W503, E203
-                ):  # サブパッケージ除外
+                    entry_name = self._get_string_utf_chars(entry_name_string)
+                    if entry_name:
+                        entry_names.append(entry_name)
 
-                    class_name = entry_name[:-6].replace(
-                        "/", "."
-                    )  # .class除去、ドット記法変換
-                    discovered_classes.append(class_name)
+            # サブパッケージを除外した.classエントリをFQCNへ変換
+            discovered_classes = _filter_jar_entries(entry_names, package_path)
 
         except Exception as e:
-            logger.warning(f"Failed to extract classes from JAR entries: {e}")
+            logger.warning("Failed to extract classes from JAR entries: %s", e)
 
         return discovered_classes
 
@@ -902,30 +1114,37 @@ class JVM:
         try:
             array_length = self._get_array_length(files_array)
 
-            for i in range(array_length):
-                file_obj = self._get_object_array_element(files_array, i)
-                if not file_obj:
-                    continue
+            # File.getNameのmethod IDをループ外で1回だけ解決する
+            file_class = self._class_File or self._find_class("java/io/File")
+            getname_mid = self.jni.GetMethodID(
+                file_class, "getName", "()Ljava/lang/String;"
+            )
+            if not getname_mid:
+                return discovered_classes
 
-                # ファイル名取得
-                file_name_string = self._call_object_method_with_signature_direct(
-                    file_obj, "getName", "()Ljava/lang/String;"
-                )
-                if not file_name_string:
-                    continue
+            with self.jni.local_frame(min(array_length * 2 + 16, 512)):
+                for i in range(array_length):
+                    file_obj = self._get_object_array_element(files_array, i)
+                    if not file_obj:
+                        continue
 
-                file_name = self._get_string_utf_chars(file_name_string)
-                if not file_name:
-                    continue
+                    # ファイル名取得
+                    file_name_string = self.jni.CallObjectMethod(file_obj, getname_mid)
+                    if not file_name_string:
+                        continue
 
-                # .classファイルのみ処理
-                if file_name.endswith(".class"):
-                    class_simple_name = file_name[:-6]  # .class除去
-                    full_class_name = f"{package_name}.{class_simple_name}"
-                    discovered_classes.append(full_class_name)
+                    file_name = self._get_string_utf_chars(file_name_string)
+                    if not file_name:
+                        continue
+
+                    # .classファイルのみ処理
+                    if file_name.endswith(".class"):
+                        class_simple_name = file_name[:-6]  # .class除去
+                        full_class_name = f"{package_name}.{class_simple_name}"
+                        discovered_classes.append(full_class_name)
 
         except Exception as e:
-            logger.warning(f"Failed to extract classes from file array: {e}")
+            logger.warning("Failed to extract classes from file array: %s", e)
 
         return discovered_classes
 
@@ -949,196 +1168,68 @@ class JVM:
                 return False
 
             array_length = self._get_array_length(packages_array)
-            for i in range(array_length):
-                package_obj = self._get_object_array_element(packages_array, i)
-                if not package_obj:
-                    continue
-
-                package_name_string = self._call_object_method_with_signature_direct(
-                    package_obj, "getName", "()Ljava/lang/String;"
-                )
-                if not package_name_string:
-                    continue
+            with self.jni.local_frame(min(array_length * 2 + 16, 512)):
+                for i in range(array_length):
+                    package_obj = self._get_object_array_element(packages_array, i)
+                    if not package_obj:
+                        continue
+
+                    name_string = self._call_object_method_with_signature_direct(
+                        package_obj, "getName", "()Ljava/lang/String;"
+                    )
+                    if not name_string:
+                        continue
 
-                pkg_name = self._get_string_utf_chars(package_name_string)
-                if pkg_name == package_name:
-                    logger.info(f"Found loaded package: {package_name}")
-                    return True
+                    pkg_name = self._get_string_utf_chars(name_string)
+                    if pkg_name == package_name:
+                        logger.info("Found loaded package: %s", package_name)
+                        return True
 
             return False
         except Exception as e:
-            logger.warning(f"Failed to verify package existence: {e}")
+            logger.warning("Failed to verify package existence: %s", e)
             return False
 
     def _discover_classes_with_forname_patterns(self, package_name: str) -> List[str]:
         """Class.forName()を使って既知のパターンでクラスを発見"""
         discovered_classes: List[str] = []
 
-        # パッケージ別の一般的なクラス名パターン
-        if package_name == "java.lang":
-            class_patterns = [
-                "Object",
-                "String",
-                "System",
-                "Class",
-                "Thread",
-                "Runtime",
-                "Integer",
-                "Long",
-                "Double",
-                "Float",
-                "Boolean",
-                "Byte",
-                "Short",
-                "Character",
-                "Number",
-                "Math",
-                "StrictMath",
-                "StringBuffer",
-                "StringBuilder",
-                "Throwable",
-                "Exception",
-                "RuntimeException",
-                "Error",
-                "ClassLoader",
-                "Package",
-                "Process",
-                "ProcessBuilder",
-                "SecurityManager",
-                "Void",
-                "Enum",
-                "Deprecated",
-                "Override",
-                "SuppressWarnings",
-                "SafeVarargs",
-                "FunctionalInterface",
-                "Cloneable",
-                "Comparable",
-                "Iterable",
-                "Readable",
-                "Runnable",
-            ]
-        elif package_name == "java.util":
-            class_patterns = [
-                "List",
-                "ArrayList",
-                "LinkedList",
-                "Vector",
-                "Stack",
-                "Set",
-                "HashSet",
-                "LinkedHashSet",
-                "TreeSet",
-                "Map",
-                "HashMap",
-                "LinkedHashMap",
-                "TreeMap",
-                "Hashtable",
-                "Collection",
-                "Collections",
-                "Arrays",
-                "Objects",
-                "Iterator",
-                "ListIterator",
-                "Enumeration",
-                "Queue",
-                "Deque",
-                "ArrayDeque",
-                "PriorityQueue",
-                "Date",
-                "Calendar",
-                "GregorianCalendar",
-                "TimeZone",
-                "Random",
-                "Scanner",
-                "Timer",
-                "TimerTask",
-                "Properties",
-                "ResourceBundle",
-                "Locale",
-                "UUID",
-                "Currency",
-                "Formatter",
-                "StringTokenizer",
-                "Observer",
-                "Observable",
-                "EventListener",
-                "EventObject",
-            ]
-        elif package_name == "java.io":
-            class_patterns = [
-                "File",
-                "InputStream",
-                "OutputStream",
-                "Reader",
-                "Writer",
-                "FileInputStream",
-                "FileOutputStream",
-                "FileReader",
-                "FileWriter",
-                "BufferedInputStream",
-                "BufferedOutputStream",
-                "BufferedReader",
-                "BufferedWriter",
-                "ByteArrayInputStream",
-                "ByteArrayOutputStream",
-                "StringReader",
-                "StringWriter",
-                "PrintWriter",
-                "PrintStream",
-                "DataInputStream",
-                "DataOutputStream",
-                "ObjectInputStream",
-                "ObjectOutputStream",
-                "RandomAccessFile",
-                "FileDescriptor",
-                "FilePermission",
-                "IOException",
-                "FileNotFoundException",
-                "EOFException",
-                "Serializable",
-                "Externalizable",
-                "ObjectInput",
-                "ObjectOutput",
-                "Closeable",
-                "Flushable",
-                "FilterInputStream",
-                "FilterOutputStream",
-            ]
-        else:
-            # その他のパッケージの場合は一般的なパターンを試す
-            class_patterns = [
-                "Object",
-                "Exception",
-                "Utils",
-                "Helper",
-                "Manager",
-                "Factory",
-                "Builder",
-                "Handler",
-                "Listener",
-                "Event",
-                "Constants",
-            ]
+        # 既知パッケージは事前結合済みFQCN、それ以外は一般パターンから結合する
+        full_class_names = _KNOWN_FQCNS.get(package_name)
+        if full_class_names is None:
+            full_class_names = tuple(
+                f"{package_name}.{name}" for name in _GENERIC_CLASS_PATTERNS
+            )
 
         # Class.forName()で各パターンを試行
-        for class_name in class_patterns:
-            full_class_name = f"{package_name}.{class_name}"
+        for full_class_name in full_class_names:
             if self._try_load_class_by_forname(full_class_name):
                 discovered_classes.append(full_class_name)
 
         return discovered_classes
 
+    def _get_forname_method(self) -> tuple[Any, Any]:
+        """Class.forNameのクラス参照とmethod IDを一度だけ解決して再利用"""
+        for_name_method = self._forname_mid
+        if for_name_method is not None:
+            return self._class_Class, for_name_method
+
+        class_class = self._class_Class or self._find_class("java/lang/Class")
+        if not class_class:
+            return None, None
+
+        for_name_method = self.jni.GetStaticMethodID(
+            class_class, "forName", "(Ljava/lang/String;)Ljava/lang/Class;"
+        )
+        if for_name_method:
+            self._class_Class = class_class
+            self._forname_mid = for_name_method
+        return class_class, for_name_method
+
     def _try_load_class_by_forname(self, class_name: str) -> bool:
         """Class.forName()を使ってクラスの存在を確認"""
         try:
-            class_class = self._find_class("java/lang/Class")
-            if not class_class:
-                return False
-
-            for_name_method = self.jni.GetStaticMethodID(
-                class_class, "forName", "(Ljava/lang/String;)Ljava/lang/Class;"
-            )
+            class_class, for_name_method = self._get_forname_method()
             if not for_name_method:
                 return False
 
@@ -1159,17 +1250,10 @@ class JVM:
     def _try_load_class_by_name(self, class_name: str) -> Optional[Any]:
         """Class.forName()を使ってクラスをロード試行"""
         try:
-            # java.lang.Classクラスを取得
-            class_class = self._find_class("java/lang/Class")
-            if not class_class:
-                raise Exception("Could not find Class class")
-
-            # Class.forName(String name)の静的メソッドIDを取得
-            for_name_method = self.jni.GetStaticMethodID(
-                class_class, "forName", "(Ljava/lang/String;)Ljava/lang/Class;"
-            )
+            # キャッシュ済みのClass参照とforName method IDを再利用
+            class_class, for_name_method = self._get_forname_method()
             if not for_name_method:
-                raise Exception("Could not find Class.forName method")
+                raise Exception("Could not resolve Class.forName method")
 
             # クラス名の文字列を作成
             class_name_string = self.jni.NewStringUTF(class_name)
@@ -1182,12 +1266,11 @@ class JVM:
             )
 
             # 例外が発生した場合は None を返す
-            if self.jni.ExceptionCheck():
-                self.jni.ExceptionClear()
+            if self.jni.check_and_clear():
                 return None
 
             return loaded_class
 
         except Exception as e:
-            logger.debug(f"Failed to load class {class_name}: {e}")
+            logger.debug("Failed to load class %s: %s", class_name, e)
             return None
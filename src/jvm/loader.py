@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import ctypes
+import logging
 import os
 import platform
 from ctypes import POINTER, byref, c_char_p, c_void_p
@@ -13,13 +14,22 @@ from .logger import logger
 class JVMLoader:
     """JVMローダー"""
 
+    # libjvmの相対パス (JAVA_HOME短絡用)
+    _LIBJVM_SUBPATHS = {
+        "windows": os.path.join("bin", "server", "jvm.dll"),
+        "darwin": os.path.join("lib", "server", "libjvm.dylib"),
+        "linux": os.path.join("lib", "server", "libjvm.so"),
+    }
+
     def __init__(self, cfg: Config) -> None:
         self.cfg = cfg
+        # 解決済みlibjvmパス (バージョン毎に1回だけ探索する)
+        self._libjvm_cache: dict[str, str] = {}
 
     def start(self) -> JVM:
         """JVM起動"""
         libjvm_path = self._find_libjvm(self.cfg.java_version)
-        logger.info(f"Using libjvm at: {libjvm_path}")
+        logger.info("Using libjvm at: %s", libjvm_path)
         libjvm = ctypes.CDLL(libjvm_path)
 
         class JavaVMOption(ctypes.Structure):
@@ -53,17 +63,20 @@ class JVMLoader:
                 b"-Djava.class.path=" + self._classpath(self.cfg).encode()
             )
             all_options.append(classpath_option)
-            logger.debug(f"JVM option: {classpath_option.decode()}")
 
         all_options.extend(resource_management_options)
 
         num_options = len(all_options)
         if num_options > 0:
-            opts = (JavaVMOption * num_options)()
-            for i, option in enumerate(all_options):
-                opts[i].optionString = option
-                if i > 0:
-                    logger.debug(f"JVM option: {option.decode()}")
+            # タプル初期化子で一括構築し、要素毎のPython代入ループを避ける
+            # ctypesはタプル初期化子を受理するがスタブの宣言が要素型のみのため
+            opts = (JavaVMOption * num_options)(
+                *((option, None) for option in all_options)  # type: ignore[misc]
+            )
+            # bytes.decodeを伴うためDEBUG有効時のみ整形する
+            if logger.is_enabled_for(logging.DEBUG):
+                for option in all_options:
+                    logger.debug("JVM option: %s", option.decode())
         else:
             opts = None
             logger.debug("No JVM options (empty classpath)")
@@ -87,8 +100,21 @@ class JVMLoader:
 
     def _find_libjvm(self, version: str) -> str:
         """libjvmライブラリパス検索"""
+        cached = self._libjvm_cache.get(version)
+        if cached is not None:
+            return cached
+
         platform_name = platform.system().lower()
 
+        # JAVA_HOMEが指す構成はstat1回で確定できるので固定リストより先に見る
+        java_home = os.environ.get("JAVA_HOME")
+        subpath = self._LIBJVM_SUBPATHS.get(platform_name)
+        if java_home and subpath:
+            candidate = os.path.join(java_home, subpath)
+            if os.path.isfile(candidate):
+                self._libjvm_cache[version] = candidate
+                return candidate
+
         if platform_name == "windows":
             paths = [
                 f"C:\\Program Files\\Java\\jdk-{version}\\bin\\server\\jvm.dll",
@@ -135,6 +161,7 @@ class JVMLoader:
 
         for path in paths:
             if os.path.exists(path):
+                self._libjvm_cache[version] = path
                 return path
 
         raise RuntimeError(
@@ -2,7 +2,7 @@
 
 import logging
 import sys
-from typing import Optional
+from typing import Callable, Optional
 
 
 class JVMLogger:
@@ -11,6 +11,13 @@ class JVMLogger:
     _instance: Optional["JVMLogger"] = None
     _logger: Optional[logging.Logger] = None
 
+    # _setup_loggerでLoggerの同名メソッドへ直結される
+    # (%s形式の遅延フォーマット、isEnabledForによる早期リターン対応)
+    info: Callable[..., None]
+    debug: Callable[..., None]
+    warning: Callable[..., None]
+    error: Callable[..., None]
+
     def __new__(cls) -> "JVMLogger":
         if cls._instance is None:
             cls._instance = super().__new__(cls)
@@ -34,25 +41,16 @@ class JVMLogger:
 
             self._logger.addHandler(handler)
 
-    def info(self, message: str) -> None:
-        """INFOログ"""
-        if self._logger:
-            self._logger.info(message)
-
-    def debug(self, message: str) -> None:
-        """DEBUGログ"""
-        if self._logger:
-            self._logger.debug(message)
+        # 各メソッドをLoggerへ直結し、呼び出し毎のガード分岐と属性連鎖を省く
+        # (Logger側がisEnabledForで早期リターンし、%s引数も遅延整形される)
+        self.info = self._logger.info
+        self.debug = self._logger.debug
+        self.warning = self._logger.warning
+        self.error = self._logger.error
 
-    def warning(self, message: str) -> None:
-        """WARNINGログ"""
-        if self._logger:
-            self._logger.warning(message)
-
-    def error(self, message: str) -> None:
-        """ERRORログ"""
-        if self._logger:
-            self._logger.error(message)
+    def is_enabled_for(self, level: int) -> bool:
+        """ログレベル有効判定（ホットパスでのメッセージ構築回避用）"""
+        return self._logger.isEnabledFor(level) if self._logger else False
 
     def set_level(self, level: int) -> None:
         """ログレベル設定"""
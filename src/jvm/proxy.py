@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import functools
+from types import SimpleNamespace
 from typing import Any
 
 from .jvm import JVM, JavaClass
@@ -16,10 +18,13 @@ class PackageProxy:
     def __getattr__(self, item: str) -> Any:
         fqcn = f"{self._pkg}.{item}"
         try:
-            self._jvm.find_class(fqcn.replace(".", "/"))
-            return ClassProxy(self._jvm, fqcn)
+            class_info = self._jvm.find_class(fqcn.replace(".", "/"))
+            proxy: Any = ClassProxy(self._jvm, fqcn, class_info)
         except Exception:
-            return PackageProxy(self._jvm, fqcn)
+            proxy = PackageProxy(self._jvm, fqcn)
+        # 解決結果を属性として束縛し、次回以降は__getattr__自体を迂回する
+        object.__setattr__(self, item, proxy)
+        return proxy
 
     def __repr__(self) -> str:
         return f"<Java package {self._pkg}>"
@@ -28,11 +33,14 @@ class PackageProxy:
 class ClassProxy:
     """Javaクラスプロキシ"""
 
-    def __init__(self, jvm: JVM, fqcn: str):
+    def __init__(self, jvm: JVM, fqcn: str, class_info: JavaClass | None = None):
         self._jvm = jvm
         self._fqcn = fqcn
         self._jclass = None
-        self._class_info: JavaClass | None = None
+        # 呼び出し元が解決済みのクラス情報を持つ場合は再探索を省く
+        self._class_info: JavaClass | None = class_info
+        # 静的フィールドIDはクラス生存中不変なのでキャッシュする
+        self._field_id_cache: dict[str, Any] = {}
 
     @property
     def _cls(self) -> Any:
@@ -51,10 +59,13 @@ class ClassProxy:
         for f in self._info.fields:
             if f.name == item:
                 try:
-                    sig = _java_type_to_sig(f.type)
-                    field_id = self._jvm.jni.GetStaticFieldID(self._cls, item, sig)
-                    if not field_id:
-                        raise RuntimeError(f"Field ID not found for {item}")
+                    field_id = self._field_id_cache.get(item)
+                    if field_id is None:
+                        sig = _java_type_to_sig(f.type)
+                        field_id = self._jvm.jni.GetStaticFieldID(self._cls, item, sig)
+                        if not field_id:
+                            raise RuntimeError(f"Field ID not found for {item}")
+                        self._field_id_cache[item] = field_id
 
                     field_val = self._jvm.jni.GetStaticObjectField(self._cls, field_id)
                     return to_python(self._jvm, field_val)
@@ -72,6 +83,10 @@ class ClassProxy:
         return f"<Java class {self._fqcn}>"
 
 
+# メソッド情報取得に失敗したオブジェクト用の共有プレースホルダ (読み取り専用)
+_EMPTY_INFO = SimpleNamespace(methods=[], fields=[])
+
+
 class ObjectProxy:
     """Javaオブジェクトプロキシ"""
 
@@ -86,21 +101,15 @@ class ObjectProxy:
             try:
                 obj_class = self._jvm.jni.GetObjectClass(self._jobject)
                 if not obj_class:
-                    self._class_info = type(
-                        "EmptyJavaClass", (), {"methods": [], "fields": []}
-                    )()
+                    self._class_info = _EMPTY_INFO
                     return self._class_info
 
                 methods = self._jvm._extract_all_methods(obj_class)
                 fields = self._jvm._extract_all_fields(obj_class)
-                self._class_info = type(
-                    "DynamicJavaClass", (), {"methods": methods, "fields": fields}
-                )()
+                self._class_info = SimpleNamespace(methods=methods, fields=fields)
 
             except Exception:
-                self._class_info = type(
-                    "EmptyJavaClass", (), {"methods": [], "fields": []}
-                )()
+                self._class_info = _EMPTY_INFO
 
         return self._class_info
 
@@ -121,26 +130,49 @@ class InstanceMethodProxy:
         self._jvm = jvm
         self._jobject = jobject
         self._overloads = overloads
+        # シグネチャは不変メタデータのみに依存するため登録時に構築する
+        self._sigs = [_build_sig(o) for o in overloads]
+        # 引数個数でバケット化し、呼び出し毎の線形走査を避ける
+        self._by_arity: dict[int, list[tuple[Any, str]]] = {}
+        for o, sig in zip(overloads, self._sigs):
+            self._by_arity.setdefault(len(o.parameters), []).append((o, sig))
+        # 単一オーバーロードは探索自体を省く (最頻のケース)
+        self._single = (overloads[0], self._sigs[0]) if len(overloads) == 1 else None
+        # GetObjectClassとmethod IDは初回解決後に再利用する
+        self._obj_class: Any = None
+        self._method_id_cache: dict[tuple[str, str], Any] = {}
 
     def __call__(self, *args: Any) -> Any:
         cand = None
         try:
             j_args = [to_java(self._jvm, a) for a in args]
 
-            cand = next(
-                (o for o in self._overloads if len(o.parameters) == len(j_args)), None
-            )
-            if not cand:
-                raise RuntimeError(
-                    f"No matching method found for {len(j_args)} arguments"
-                )
-
-            sig = _build_sig(cand)
-
-            obj_class = self._jvm.jni.GetObjectClass(self._jobject)
-            mid = self._jvm.jni.GetMethodID(obj_class, cand.name, sig)
-            if not mid:
-                raise RuntimeError(f"MethodID resolve failed for {cand.name}")
+            single = self._single
+            if single is not None:
+                cand, sig = single
+                if len(j_args) != len(cand.parameters):
+                    cand = None
+                    raise RuntimeError(
+                        f"No matching method found for {len(j_args)} arguments"
+                    )
+            else:
+                candidates = self._by_arity.get(len(j_args))
+                if not candidates:
+                    raise RuntimeError(
+                        f"No matching method found for {len(j_args)} arguments"
+                    )
+                cand, sig = candidates[0]
+
+            mid = self._method_id_cache.get((cand.name, sig))
+            if mid is None:
+                obj_class = self._obj_class
+                if obj_class is None:
+                    obj_class = self._jvm.jni.GetObjectClass(self._jobject)
+                    self._obj_class = obj_class
+                mid = self._jvm.jni.GetMethodID(obj_class, cand.name, sig)
+                if not mid:
+                    raise RuntimeError(f"MethodID resolve failed for {cand.name}")
+                self._method_id_cache[(cand.name, sig)] = mid
 
             if cand.return_type == "void":
                 self._jvm.jni.CallVoidMethod(self._jobject, mid, *j_args)
@@ -164,25 +196,41 @@ class MethodProxy:
         self._jvm = jvm
         self._jclass = jclass
         self._overloads = overloads
+        # シグネチャは不変メタデータのみに依存するため登録時に構築する
+        self._sigs = [_build_sig(o) for o in overloads]
+        # 引数個数でバケット化し、呼び出し毎の線形走査を避ける
+        self._by_arity: dict[int, list[tuple[Any, str]]] = {}
+        for o, sig in zip(overloads, self._sigs):
+            self._by_arity.setdefault(len(o.parameters), []).append((o, sig))
+        # 単一オーバーロードは探索自体を省く (最頻のケース)
+        self._single = (overloads[0], self._sigs[0]) if len(overloads) == 1 else None
+        # 静的method IDはクラス生存中不変なのでキャッシュする
+        self._method_id_cache: dict[tuple[str, str], Any] = {}
 
     def __call__(self, *args: Any) -> Any:
         j_args = [to_java(self._jvm, a) for a in args]
 
-        def matches_signature(overload: Any, java_args: list[Any]) -> bool:
-            if len(overload.parameters) != len(java_args):
-                return False
-            for param_type, arg in zip(overload.parameters, args):
-                if param_type == "int" and not isinstance(arg, int):
-                    return False
-                elif param_type == "java.lang.String" and not isinstance(arg, str):
-                    return False
-            return True
-
-        cand = next(o for o in self._overloads if matches_signature(o, j_args))
-        sig = _build_sig(cand)
-        mid = self._jvm.jni.GetStaticMethodID(self._jclass, cand.name, sig)
-        if not mid:
-            raise RuntimeError("MethodID resolve failed")
+        single = self._single
+        if single is not None:
+            cand, sig = single
+            if len(j_args) != len(cand.parameters) or not _matches_signature(
+                cand, args
+            ):
+                cand = None
+        else:
+            candidates = self._by_arity.get(len(j_args), ())
+            cand, sig = next(
+                ((o, s) for o, s in candidates if _matches_signature(o, args)),
+                (None, ""),
+            )
+        if cand is None:
+            raise RuntimeError(f"No matching method found for {len(j_args)} arguments")
+        mid = self._method_id_cache.get((cand.name, sig))
+        if mid is None:
+            mid = self._jvm.jni.GetStaticMethodID(self._jclass, cand.name, sig)
+            if not mid:
+                raise RuntimeError("MethodID resolve failed")
+            self._method_id_cache[(cand.name, sig)] = mid
 
         res = self._jvm.jni.CallStaticObjectMethod(self._jclass, mid, *j_args)
         return to_python(self._jvm, res)
@@ -192,21 +240,46 @@ class MethodProxy:
         return f"<Java static method [{ol}]>"
 
 
+# Python側の型を確認できるJava型の対応表
+_TYPE_CHECKS: dict[str, type] = {
+    "int": int,
+    "java.lang.String": str,
+}
+
+
+def _matches_signature(overload: Any, args: tuple[Any, ...]) -> bool:
+    """オーバーロードのパラメータ型と実引数の型整合を確認
+
+    arityバケットが引数個数の一致を保証するため型のみ確認する。
+    """
+    parameters = overload.parameters
+    for i in range(len(parameters)):
+        expected = _TYPE_CHECKS.get(parameters[i])
+        if expected is not None and not isinstance(args[i], expected):
+            return False
+    return True
+
+
+# プリミティブ型のJNIシグネチャ表 (呼び出し毎の辞書構築を避ける)
+_PRIM_SIG = {
+    "int": "I",
+    "long": "J",
+    "float": "F",
+    "double": "D",
+    "boolean": "Z",
+    "void": "V",
+    "byte": "B",
+    "char": "C",
+    "short": "S",
+}
+
+
+@functools.lru_cache(maxsize=1024)
 def _java_type_to_sig(jtype: str) -> str:
     """Java型からJNIシグネチャ変換"""
-    PRIM = {
-        "int": "I",
-        "long": "J",
-        "float": "F",
-        "double": "D",
-        "boolean": "Z",
-        "void": "V",
-        "byte": "B",
-        "char": "C",
-        "short": "S",
-    }
-    if jtype in PRIM:
-        return PRIM[jtype]
+    sig = _PRIM_SIG.get(jtype)
+    if sig is not None:
+        return sig
     return "L" + jtype.replace(".", "/") + ";"
 
 
@@ -3,5 +3,8 @@ import sys
 from .import_hook.finder import JavaFinder
 
 # import hook設定
+# 先頭に登録する: 末尾だとsite-packagesのスタブディレクトリを
+# PathFinderが名前空間パッケージとして先に解決してしまう
+# (非Java importのコストはfinder側のルート名frozenset判定で回避済み)
 if not any(isinstance(f, JavaFinder) for f in sys.meta_path):
     sys.meta_path.insert(0, JavaFinder())
@@ -345,16 +345,17 @@ class PyiStubGenerator:
 
     def get_java_class(self, class_name: str) -> JavaClass:
         """Javaクラスキャッシュ取得"""
-        if class_name not in self.class_cache:
-            try:
-                self.class_cache[class_name] = self.jvm.find_class(
-                    class_name.replace(".", "/")
-                )
-            except Exception:
-                self.class_cache[class_name] = JavaClass(
-                    name=class_name, methods=[], fields=[]
-                )
-        return self.class_cache[class_name]
+        cached = self.class_cache.get(class_name)
+        if cached is not None:
+            return cached
+
+        try:
+            java_class = self.jvm.find_class(class_name.replace(".", "/"))
+        except Exception:
+            java_class = JavaClass(name=class_name, methods=[], fields=[])
+
+        # setdefaultで並列生成時も単一インスタンスを共有
+        return self.class_cache.setdefault(class_name, java_class)
 
     def collect_dependencies(
         self, java_class: JavaClass, target_package: Optional[str] = None
@@ -0,0 +1,103 @@
+"""Tests for stub installer CLI helpers."""
+
+from pathlib import Path
+from unittest.mock import Mock, patch
+
+import pytest
+
+from jvm.cli import STUB_FINGERPRINT_FILE, StubFileManager, StubInstaller
+
+
+class TestStubFingerprintMarker:
+    """Test fingerprint-marker based regeneration skipping."""
+
+    def _manager(self, fingerprint: str = "fp-1") -> StubFileManager:
+        manager = StubFileManager()
+        # Avoid probing libjvm while computing the fingerprint
+        manager._stub_fingerprint = Mock(  # type: ignore[method-assign]
+            return_value=fingerprint
+        )
+        return manager
+
+    def test_generate_skipped_when_marker_current(self, temp_directory: Path) -> None:
+        """A marker matching the fingerprint skips JVM startup entirely."""
+        manager = self._manager("fp-1")
+        marker = temp_directory / STUB_FINGERPRINT_FILE
+        marker.write_text("fp-1")
+
+        with (
+            patch("jvm.cli.Config.from_pyproject"),
+            patch("jvm.cli.JVMLoader") as mock_loader_class,
+        ):
+            assert manager.generate_stubs(temp_directory / "out", marker) is True
+
+        mock_loader_class.assert_not_called()
+
+    def test_generate_runs_when_marker_stale(self, temp_directory: Path) -> None:
+        """A stale marker triggers regeneration and can then be refreshed."""
+        manager = self._manager("fp-2")
+        marker = temp_directory / STUB_FINGERPRINT_FILE
+        marker.write_text("fp-1")
+
+        with (
+            patch("jvm.cli.Config.from_pyproject"),
+            patch("jvm.cli.JVMLoader") as mock_loader_class,
+            patch("jvm.cli.PyiStubGenerator"),
+        ):
+            assert manager.generate_stubs(temp_directory / "out", marker) is True
+
+        mock_loader_class.assert_called_once()
+        manager.write_fingerprint_marker(marker)
+        assert marker.read_text() == "fp-2"
+
+    def test_marker_not_written_after_failed_generation(
+        self, temp_directory: Path
+    ) -> None:
+        """A partially failed generation must not be frozen as current."""
+        manager = self._manager("fp-1")
+        marker = temp_directory / STUB_FINGERPRINT_FILE
+
+        with (
+            patch("jvm.cli.Config.from_pyproject"),
+            patch("jvm.cli.JVMLoader"),
+            patch("jvm.cli.PyiStubGenerator") as mock_generator_class,
+        ):
+            mock_generator = Mock()
+            mock_generator.generate_package_stub.side_effect = RuntimeError("boom")
+            mock_generator_class.return_value = mock_generator
+
+            assert manager.generate_stubs(temp_directory / "out", marker) is False
+
+        manager.write_fingerprint_marker(marker)
+        assert not marker.exists()
+
+    def test_force_regenerate_bypasses_marker(
+        self, temp_directory: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """force_regenerate must not consult the fingerprint marker."""
+        monkeypatch.chdir(temp_directory)
+        installer = StubInstaller()
+        installer.file_manager.generate_stubs = Mock(  # type: ignore[method-assign]
+            return_value=True
+        )
+        marker = temp_directory / STUB_FINGERPRINT_FILE
+
+        source, temp_dir = installer._get_stub_source(True, marker)
+
+        assert source == temp_dir
+        installer.file_manager.generate_stubs.assert_called_once_with(temp_dir, None)
+
+    def test_uninstall_removes_marker(self, temp_directory: Path) -> None:
+        """Uninstalling stubs must also drop the fingerprint marker."""
+        installer = StubInstaller()
+        installer.venv_detector.detect_venv = Mock(  # type: ignore[method-assign]
+            return_value=temp_directory
+        )
+        (temp_directory / "java").mkdir()
+        marker = temp_directory / STUB_FINGERPRINT_FILE
+        marker.write_text("fp-1")
+
+        assert installer.uninstall_stubs() is True
+
+        assert not (temp_directory / "java").exists()
+        assert not marker.exists()
@@ -1,5 +1,6 @@
 """Tests for JVM configuration system."""
 
+import os
 from pathlib import Path
 from unittest.mock import patch
 
@@ -305,3 +306,45 @@ deps = {}
         assert "java_version='17'" in repr_str
         assert "maven" in repr_str
         assert "test.jar" in repr_str
+
+
+class TestConfigCaching:
+    """Test pyproject parse caching and mtime invalidation."""
+
+    def test_from_pyproject_reloads_on_mtime_change(self, temp_directory: Path) -> None:
+        """Editing pyproject.toml invalidates the cached parse."""
+        pyproject_path = temp_directory / "pyproject.toml"
+        pyproject_path.write_text('[tool.jvm]\njava-version = "11"\n')
+
+        with patch(
+            "jvm.config.Config._find_pyproject_toml", return_value=pyproject_path
+        ):
+            assert Config.from_pyproject().java_version == "11"
+
+            pyproject_path.write_text('[tool.jvm]\njava-version = "21"\n')
+            # Force a distinct mtime even on coarse filesystem clocks
+            stat = pyproject_path.stat()
+            os.utime(
+                pyproject_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000)
+            )
+
+            assert Config.from_pyproject().java_version == "21"
+
+    def test_from_pyproject_returns_fresh_copies(self, temp_directory: Path) -> None:
+        """Mutating a returned config must not poison the cache."""
+        pyproject_path = temp_directory / "pyproject.toml"
+        pyproject_path.write_text(
+            '[tool.jvm]\njava-version = "17"\nclasspath = ["a.jar"]\n'
+        )
+
+        with patch(
+            "jvm.config.Config._find_pyproject_toml", return_value=pyproject_path
+        ):
+            first = Config.from_pyproject()
+            first.classpath.append("mutated.jar")
+            first.deps["maven"] = ["injected"]
+
+            second = Config.from_pyproject()
+
+        assert second.classpath == ["a.jar"]
+        assert second.deps == {}
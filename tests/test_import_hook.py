@@ -121,8 +121,8 @@ class TestJavaFinder:
         finder = JavaFinder()
 
         with (
-            patch("jvm.import_hook.finder.Config") as mock_config_class,
-            patch("jvm.import_hook.finder.JVMLoader") as mock_loader_class,
+            patch("jvm.config.Config") as mock_config_class,
+            patch("jvm.loader.JVMLoader") as mock_loader_class,
         ):
 
             mock_config = Mock()
@@ -147,7 +147,7 @@ class TestJavaFinder:
         mock_jvm = Mock()
         finder._jvm = mock_jvm  # Pre-populate cache
 
-        with patch("jvm.import_hook.finder.Config") as mock_config_class:
+        with patch("jvm.config.Config") as mock_config_class:
             result = finder._get_jvm()
 
             assert result == mock_jvm
@@ -159,29 +159,30 @@ class TestJavaFinder:
         finder = JavaFinder()
         results = []
 
-        def worker() -> None:
-            with (
-                patch("jvm.import_hook.finder.Config") as mock_config_class,
-                patch("jvm.import_hook.finder.JVMLoader") as mock_loader_class,
-            ):
+        # Patch once from the main thread; entering/exiting patch() from
+        # worker threads concurrently races on the restored original.
+        with (
+            patch("jvm.config.Config") as mock_config_class,
+            patch("jvm.loader.JVMLoader") as mock_loader_class,
+        ):
 
-                mock_config = Mock()
-                mock_config_class.from_pyproject.return_value = mock_config
+            mock_config = Mock()
+            mock_config_class.from_pyproject.return_value = mock_config
 
-                mock_loader = Mock()
-                mock_jvm = Mock()
-                mock_loader.start.return_value = mock_jvm
-                mock_loader_class.return_value = mock_loader
+            mock_loader = Mock()
+            mock_jvm = Mock()
+            mock_loader.start.return_value = mock_jvm
+            mock_loader_class.return_value = mock_loader
 
-                result = finder._get_jvm()
-                results.append(result)
+            def worker() -> None:
+                results.append(finder._get_jvm())
 
-        # Start multiple threads
-        threads = [threading.Thread(target=worker) for _ in range(5)]
-        for thread in threads:
-            thread.start()
-        for thread in threads:
-            thread.join()
+            # Start multiple threads
+            threads = [threading.Thread(target=worker) for _ in range(5)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
 
         # All threads should get the same JVM instance
         assert len(set(id(r) for r in results)) == 1  # All results are the same object
@@ -379,8 +380,8 @@ class TestImportHookIntegration:
         finder = JavaFinder()
 
         with (
-            patch("jvm.import_hook.finder.Config") as mock_config_class,
-            patch("jvm.import_hook.finder.JVMLoader") as mock_loader_class,
+            patch("jvm.config.Config") as mock_config_class,
+            patch("jvm.loader.JVMLoader") as mock_loader_class,
         ):
 
             # Setup mocks
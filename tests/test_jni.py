@@ -1,5 +1,8 @@
 """Tests for JNI layer functionality."""
 
+import ctypes
+import struct
+
 import pytest
 
 from jvm.jni import _convert_args_to_jvalue_array
@@ -580,3 +583,79 @@ class TestJValueConversion:
         array, count = result
         assert array is not None
         assert count == 4
+
+
+def _slot(array: object, index: int) -> bytes:
+    """Return the raw bytes of one 8-byte jvalue slot."""
+    raw = bytes(array)  # type: ignore[call-overload]
+    return raw[index * 8 : (index + 1) * 8]  # noqa: E203
+
+
+class TestJValueByteLayout:
+    """Byte-level tests for jvalue slot packing."""
+
+    def test_bool_slots(self) -> None:
+        """Booleans pack as a single jboolean byte (1/0)."""
+        array, count = _convert_args_to_jvalue_array((True, False))
+        assert count == 2
+        assert _slot(array, 0) == b"\x01" + b"\x00" * 7
+        assert _slot(array, 1) == b"\x00" * 8
+
+    def test_small_int_packs_as_jint(self) -> None:
+        """Ints within jint range pack little-endian into 4 bytes."""
+        array, _ = _convert_args_to_jvalue_array((42,))
+        assert _slot(array, 0) == struct.pack("<i", 42) + b"\x00" * 4
+
+    def test_negative_int_packs_as_jint(self) -> None:
+        """Negative jint values keep two's-complement byte layout."""
+        array, _ = _convert_args_to_jvalue_array((-7,))
+        assert _slot(array, 0)[:4] == struct.pack("<i", -7)
+
+    def test_large_int_packs_as_jlong(self) -> None:
+        """Ints beyond jint range pack as 8-byte jlong."""
+        value = 2**40
+        array, _ = _convert_args_to_jvalue_array((value,))
+        assert _slot(array, 0) == struct.pack("<q", value)
+
+    def test_float_packs_as_jdouble(self) -> None:
+        """Floats pack as 8-byte IEEE-754 doubles."""
+        array, _ = _convert_args_to_jvalue_array((2.5,))
+        assert _slot(array, 0) == struct.pack("<d", 2.5)
+
+    def test_none_slot_is_zero(self) -> None:
+        """None leaves the slot as a NULL object handle."""
+        array, _ = _convert_args_to_jvalue_array((None,))
+        assert _slot(array, 0) == b"\x00" * 8
+
+    def test_handle_packs_pointer_value(self) -> None:
+        """ctypes handles pack their raw pointer value."""
+        handle = ctypes.c_void_p(0x1234)
+        array, _ = _convert_args_to_jvalue_array((handle,))
+        assert _slot(array, 0) == struct.pack("<Q", 0x1234)
+
+    def test_int_subclass_packs_as_primitive(self) -> None:
+        """Subclasses of int must pack as jint, not as object handles."""
+
+        class TaggedInt(int):
+            pass
+
+        array, _ = _convert_args_to_jvalue_array((TaggedInt(7),))
+        assert _slot(array, 0)[:4] == struct.pack("<i", 7)
+
+    def test_mixed_args_use_consecutive_slots(self) -> None:
+        """Each argument occupies its own 8-byte slot in order."""
+        array, count = _convert_args_to_jvalue_array((True, 5, 2.5))
+        assert count == 3
+        assert _slot(array, 0)[0] == 1
+        assert _slot(array, 1)[:4] == struct.pack("<i", 5)
+        assert _slot(array, 2) == struct.pack("<d", 2.5)
+
+    def test_unconvertible_object_raises_type_error(self) -> None:
+        """Objects without a pointer value must fail loudly, not pack NULL."""
+        with pytest.raises(TypeError):
+            _convert_args_to_jvalue_array((object(),))
+
+    def test_null_handle_stays_null(self) -> None:
+        """A NULL ctypes handle is a legal NULL jobject slot."""
+        array, _ = _convert_args_to_jvalue_array((ctypes.c_void_p(None),))
+        assert _slot(array, 0) == b"\x00" * 8
@@ -1,5 +1,7 @@
 """Tests for JVM management functionality."""
 
+from unittest.mock import Mock, patch
+
 import pytest
 
 from jvm.jvm import JVM, JavaClass, JNIException
@@ -120,3 +122,62 @@ class TestJVMBasicOperations:
         assert result == 0
 
         jvm_instance.jni.PopLocalFrame(None)
+
+
+def _make_jvm_with_mock_jni(mock_jni: Mock) -> JVM:
+    """Build a JVM instance backed by a mocked JNI helper."""
+    with (
+        patch("jvm.jvm.JNIHelper", return_value=mock_jni),
+        patch.object(JVM, "_prime_well_known_classes"),
+    ):
+        return JVM(Mock(), Mock())
+
+
+class TestClassCacheBehavior:
+    """Test class cache hits, negative caching and LRU eviction."""
+
+    def test_find_class_cache_hit_skips_jni(self) -> None:
+        """A cached class is returned without another FindClass round trip."""
+        jni = Mock()
+        jni.FindClass.return_value = "local_ref"
+        jni.NewGlobalRef.return_value = "global_ref"
+        jvm = _make_jvm_with_mock_jni(jni)
+
+        first = jvm._find_class("java/lang/String")
+        second = jvm._find_class("java/lang/String")
+
+        assert first == "global_ref"
+        assert second is first
+        assert jni.FindClass.call_count == 1
+
+    def test_find_class_negative_cache_short_circuits(self) -> None:
+        """A known-missing class fails again without touching JNI."""
+        jni = Mock()
+        jni.FindClass.return_value = None
+        jvm = _make_jvm_with_mock_jni(jni)
+
+        with pytest.raises(JNIException):
+            jvm._find_class("no/such/Class")
+        assert jni.FindClass.call_count == 1
+
+        with pytest.raises(JNIException):
+            jvm._find_class("no/such/Class")
+        assert jni.FindClass.call_count == 1  # served from the miss cache
+
+    def test_find_class_lru_eviction_releases_oldest(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Overflow evicts the least recently used entry and frees its ref."""
+        monkeypatch.setattr("jvm.jvm.MAX_CLASS_CACHE", 2)
+        jni = Mock()
+        jni.FindClass.side_effect = lambda name: f"local:{name}"
+        jni.NewGlobalRef.side_effect = lambda local: local.replace("local", "global")
+        jvm = _make_jvm_with_mock_jni(jni)
+
+        jvm._find_class("a/A")
+        jvm._find_class("b/B")
+        jvm._find_class("a/A")  # refresh A so B becomes the oldest
+        jvm._find_class("c/C")  # overflow: B must be evicted
+
+        jni.DeleteGlobalRef.assert_called_once_with("global:b/B")
+        assert list(jvm._class_cache) == ["a/A", "c/C"]
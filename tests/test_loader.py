@@ -303,6 +303,46 @@ class TestFindLibjvm:
 
         assert result == adoptium_path
 
+    def test_find_libjvm_java_home_short_circuit(
+        self,
+        mock_platform: dict[str, Any],
+        mock_os_path_exists: Mock,
+        monkeypatch: pytest.MonkeyPatch,
+        tmp_path: Any,
+    ) -> None:
+        """Test that a valid JAVA_HOME is used before the fixed path list."""
+        mock_platform["system"] = "Linux"
+        libjvm = tmp_path / "lib" / "server" / "libjvm.so"
+        libjvm.parent.mkdir(parents=True)
+        libjvm.write_bytes(b"")
+        monkeypatch.setenv("JAVA_HOME", str(tmp_path))
+
+        config = Config(java_version="17", deps={}, classpath=[])
+        loader = JVMLoader(config)
+
+        result = loader._find_libjvm("17")
+
+        assert result == str(libjvm)
+        # Fixed-path probing should be skipped entirely
+        assert mock_os_path_exists.call_count == 0
+
+    def test_find_libjvm_result_is_cached(
+        self, mock_platform: dict[str, Any], mock_os_path_exists: Mock
+    ) -> None:
+        """Test that a resolved path is reused without re-probing."""
+        mock_platform["system"] = "Linux"
+        config = Config(java_version="17", deps={}, classpath=[])
+        loader = JVMLoader(config)
+
+        expected_path = "/usr/lib/jvm/java-17-openjdk/lib/server/libjvm.so"
+        mock_os_path_exists.side_effect = lambda path: path == expected_path
+
+        assert loader._find_libjvm("17") == expected_path
+        first_call_count = mock_os_path_exists.call_count
+
+        assert loader._find_libjvm("17") == expected_path
+        assert mock_os_path_exists.call_count == first_call_count
+
 
 class TestClasspathGeneration:
     """Test classpath generation functionality."""
@@ -455,7 +455,7 @@ class TestMethodProxy:
         with patch("jvm.proxy.to_java") as mock_to_java:
             mock_to_java.return_value = "string_arg"
 
-            with pytest.raises(StopIteration):
+            with pytest.raises(RuntimeError, match="No matching method found"):
                 # This will fail because we pass 1 string arg but method expects 1 int arg
                 proxy("string_arg")
 